@@ -1,17 +1,76 @@
 import os
-from collections import defaultdict
-from typing import List, Dict, Optional, Tuple
+import asyncio
+from contextlib import asynccontextmanager
+from collections import Counter, defaultdict, deque, OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from typing import Awaitable, Callable, Iterator, List, Dict, Optional, Tuple
 from mistralai import Mistral
 import discord
 import aiohttp
+from rapidfuzz import fuzz, process
 import logging
-from bs4 import BeautifulSoup
+import hashlib
+import json
+import re
+import lxml.html
+from lxml import etree
 import time
 from datetime import datetime
 
 # Setup logging
 logger = logging.getLogger("discord")
 
+def _xpath_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name (like BeautifulSoup's class_)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Precompiled XPath queries for the ESPN player page
+ESPN_TEAM_XPATH = etree.XPath(f"(//div[{_xpath_class('PlayerHeader__Main_Aside')}])[1]//a[{_xpath_class('AnchorLink')}]")
+ESPN_NEWS_XPATH = etree.XPath(f"(//div[{_xpath_class('FantasyOverview__News')}])[1]")
+ESPN_NEWS_TIME_XPATH = etree.XPath(f"(.//p[{_xpath_class('nws')}])[1]//span[{_xpath_class('FantasyNews__relDate')}]")
+ESPN_NEWS_CONTENT_XPATH = etree.XPath(f"(.//p[{_xpath_class('nws')}])[1]//span[{_xpath_class('FantasyNews__content')}]")
+ESPN_SPIN_XPATH = etree.XPath(f"(.//p[{_xpath_class('spn')}])[1]//span")
+# First player profile link on an ESPN search results page, matched against the raw response bytes
+ESPN_PLAYER_LINK_RE = re.compile(rb'<a\b[^>]*\bhref="[^"]*/nba/player/_/id/(\d+)')
+# Basketball Reference game log (first row is the most recent game)
+BREF_LATEST_GAME_XPATH = etree.XPath('(//div[@id="div_pgl_basic"])[1]/descendant::tr[1]')
+def data_stat_cells(row) -> Dict[str, str]:
+    """Map each data-stat attribute in a Basketball Reference table row to its cell text, in one walk"""
+    cells = {}
+    for cell in row.iter('td', 'th'):
+        stat = cell.get('data-stat')
+        if stat and stat not in cells:  # First cell wins, like find()
+            cells[stat] = cell.text_content()
+    return cells
+
+def schedule_rows_mentioning(raw: bytes, needle: bytes) -> Iterator[bytes]:
+    """Yield raw <tr> fragments of the Basketball Reference schedule table whose markup contains needle.
+    
+    Scans the response bytes directly so the full-season schedule is never parsed into a tree;
+    needle must be lowercase since rows are compared after an ASCII lower().
+    """
+    start = raw.find(b'id="div_schedule"')
+    if start == -1:
+        return
+    end = raw.find(b'</table>', start)
+    section = raw[start:end] if end != -1 else raw[start:]
+    for chunk in section.split(b'<tr')[1:]:
+        row_end = chunk.find(b'</tr>')
+        row = b'<tr' + (chunk[:row_end + 5] if row_end != -1 else chunk)
+        if needle in row.lower():
+            yield row
+
+# HashtagBasketball rankings table
+RANKINGS_TABLE_XPATH = etree.XPath('(//table[@id="ContentPlaceHolder1_GridView1"])[1]')
+
+def _cell_text(element) -> str:
+    """Concatenate an element's stripped text fragments (like BeautifulSoup's get_text(strip=True))"""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
 from enum import Enum
 
 MISTRAL_MODEL = "mistral-large-latest"
@@ -35,7 +94,111 @@ Format your response as follows (keep it under 1900 characters):
 5. Use bullet points for key points to save space
 6. Avoid unnecessary details and focus on the most important factors"""
 
+DRAFT_PROMPT = """You are a fantasy basketball draft expert. Consider:
+1. Current round: {current_round}/{total_rounds}
+2. Draft position: Pick {pick_position} of {total_players}
+3. Current pick in round: {current_pick}/{total_players}
+4. Picks until your turn: {picks_until_turn}
+5. My team so far: {my_team}
+6. Roster needs:
+{needs_str}
+
+Current player information:
+Before recommending, recall the latest fantasy rankings, current stats and injury status of these top available players: {available_players_str}
+
+Provide draft recommendations in strictly in the following format:
+1. Draft Position Analysis: 2-3 sentences about the current draft state and picks until your turn
+2. Draft Strategy: 2-3 sentences about what to prioritize based on draft position, current pick, and team needs
+3. Top Available Players: List 5 best available players with 1-line explanation for each
+4. Recommendations:
+   - If it's your turn: State best pick and second-best pick with brief reasoning
+   - If not your turn: List 2-3 players you hope will still be available at your pick
+
+Focus on:
+- Draft position strategy (who might be available at your pick)
+- Team needs and roster construction
+- Position scarcity
+- Injury status and availability
+- Recent performance and trends"""
+
+# Shared, never-mutated system message that opens every chat request
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Static pieces of COMPARE_PROMPT around the per-request player information, split once at import
+COMPARE_PROMPT_PREFIX, _, COMPARE_PROMPT_SUFFIX = COMPARE_PROMPT.partition("{current_info}")
+
+# Injury keywords in web search results, most severe first; re.I avoids lowercasing each result
+SEASON_ENDING_RE = re.compile(r'season[- ]?ending|out for (the )?season', re.I)
+# Negations earlier in the same sentence ("has not suffered a season-ending injury")
+SEASON_ENDING_NEGATION_RE = re.compile(r"\b(?:not|no|never|without|avoid(?:s|ed)?)\b|n't\b|\bruled out\b(?!\s+for\b)", re.I)
+SENTENCE_BREAK_RE = re.compile(r'[.!?\n]')
+LONG_TERM_RE = re.compile(r'out indefinitely|out for|expected to miss|several weeks', re.I)
+DAY_TO_DAY_RE = re.compile(r'day-to-day|questionable|probable', re.I)
+SEASON_ENDING_INFO_CHARS = 500  # Characters of search result kept for players already ruled out for the season
+
+def reports_season_ending(text: str) -> bool:
+    """Whether text says a player is out for the season, ignoring negated mentions.
+    
+    The probe query itself asks about a season-ending injury, so replies often repeat the
+    phrase to deny it; only a mention without a negation earlier in its sentence counts.
+    """
+    for match in SEASON_ENDING_RE.finditer(text):
+        sentence_start = max((m.end() for m in SENTENCE_BREAK_RE.finditer(text, 0, match.start())), default=0)
+        if not SEASON_ENDING_NEGATION_RE.search(text, sentence_start, match.start()):
+            return True
+    return False
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Request headers, built once and shared by every request
+SESSION_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html',
+    'Accept-Encoding': 'gzip, br'  # Brotli decoding comes from aiohttp[speedups]
+}
+RANKINGS_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+NEWS_SCRAPE_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Origin': 'https://www.nba.com',
+    'Referer': 'https://www.nba.com/'
+}
+
+NEWS_SEARCH_URL = "https://www.bing.com/news/search"  # Returns dated news snippets as RSS with format=rss
+NEWS_SEARCH_HEADERS = {'Accept': 'application/rss+xml,application/xml;q=0.9'}
+NEWS_SEARCH_MAX_ITEMS = 5  # News items kept per search
+NEWS_SEARCH_ITEMS_XPATH = etree.XPath('/rss/channel/item')
+NEWS_SEARCH_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
 MAX_HISTORY = 10  # Maximum number of messages to keep in history per channel
+PLAYER_MATCH_CUTOFF = 75  # Minimum rapidfuzz WRatio score to accept a fuzzy player name match
+PLAYER_MATCH_CANDIDATES = 5  # Top fuzzy candidates checked name-part by name-part before giving up
+NAME_TOKEN_CUTOFF = 80  # Minimum rapidfuzz ratio for a search name part to count as the same as a player's
+PLAYER_MATCH_CACHE_SIZE = 1024  # Maximum memoized name lookups per rankings snapshot
+WEB_SEARCH_CACHE_SIZE = 512  # Maximum number of web search results to memoize
+WEB_SEARCH_CACHE_TTL = 1800  # Seconds before a memoized web search result is re-issued
+PLAYERS_CACHE_TTL = 3600  # Seconds before the HashtagBasketball rankings are re-fetched
+PLAYERS_REFRESH_INTERVAL = 600  # Seconds between background rankings refreshes, well inside the cache TTL
+PLAYERS_CACHE_KEY = "rankings"  # Single key under which the rankings snapshot is cached
+NEWS_CACHE_SIZE = 512  # Maximum number of players whose ESPN news is cached
+NEWS_CACHE_TTL = 600  # Seconds before cached ESPN news is re-fetched
+SCRAPE_CACHE_SIZE = 512  # Maximum number of players whose Basketball Reference news is cached
+SCRAPE_CACHE_TTL = 300  # Seconds before cached Basketball Reference news is re-scraped
+RECOMMENDATION_CACHE_SIZE = 128  # Maximum number of draft recommendations to memoize
+RECOMMENDATION_CACHE_TTL = 900  # Seconds before an identical draft state gets a fresh recommendation
+ESPN_ID_CACHE_SIZE = 512  # Maximum number of looked-up ESPN player IDs to keep
+HOST_MAX_CONCURRENCY = 6  # Maximum simultaneous requests to any one site
+READ_CHUNK_SIZE = 16384  # Bytes per chunk when reading a page body incrementally
+READ_CAP_BYTES = 2_000_000  # Most bytes read from a page whose sentinel never appears
+ESPN_NEWS_TAIL_BYTES = 32768  # Bytes kept after the ESPN fantasy news marker to cover its news and spin
+BREF_GAME_LOG_TAIL_BYTES = 16384  # Bytes kept after the Basketball Reference game log marker to cover its first row
+NEWS_WARM_PLAYERS = 25  # Number of top-ranked players whose news is prefetched
+NEWS_WARM_MARGIN = 60  # Seconds before warmed news would expire that the next warm-up starts
+NEWS_WARM_INTERVAL = NEWS_CACHE_TTL - NEWS_WARM_MARGIN  # Seconds between news cache warm-ups; shorter than the TTL so warmed entries never lapse
+STREAM_UPDATE_INTERVAL = 1.0  # Minimum seconds between partial-response callbacks while streaming
 
 class Position(Enum):
     PG = "Point Guard"
@@ -47,6 +210,204 @@ class Position(Enum):
     F = "Forward"
     UTIL = "Utility"
 
+def normalize_name(name: str) -> str:
+    """Normalize a name by removing special characters and converting to lowercase"""
+    # Remove periods, apostrophes, and other special characters
+    name = ''.join(c for c in name if c.isalnum() or c.isspace())
+    return name.lower().strip()
+
+NAME_SUFFIXES = frozenset({"jr", "jr.", "sr", "sr.", "ii", "iii", "iv"})  # Tokens that never identify a player alone
+
+def name_parts_agree(normalized_search: str, normalized_name: str) -> bool:
+    """Whether every part of a search name (suffixes aside) is contained in or a close spelling of some part of a player's name.
+    
+    Keeps a high overall fuzzy score from pairing different players who share a first or last name,
+    such as "mike williams" and "mark williams".
+    """
+    name_parts = normalized_name.split()
+    return all(
+        any(part in name_part or fuzz.ratio(part, name_part) >= NAME_TOKEN_CUTOFF for name_part in name_parts)
+        for part in normalized_search.split() if part not in NAME_SUFFIXES
+    )
+
+class PlayerNameIndex:
+    """Normalized player names for one rankings snapshot, built once for fuzzy lookups"""
+    def __init__(self, players_map: Dict[str, Dict[str, str]]):
+        self.players_map = players_map
+        self.names = list(players_map)  # Original names, parallel to choices
+        self.choices = [normalize_name(name) for name in self.names]  # Normalized names for rapidfuzz
+        self.by_normalized = dict(zip(self.choices, self.names))  # Normalized name -> original name
+        self.by_compact = {choice.replace(" ", ""): name for choice, name in zip(self.choices, self.names)}  # Spaceless form -> original name
+        self._matches: Dict[str, Optional[str]] = {}  # Normalized search -> resolved name, dropped with the index
+    
+    def match(self, normalized_search: str) -> Optional[str]:
+        """Resolve a normalized search name to a player name in this snapshot, memoizing the result"""
+        if normalized_search in self._matches:
+            return self._matches[normalized_search]
+        
+        # Exact match (with or without spaces) is a single dict lookup
+        player_name = self.by_normalized.get(normalized_search) or self.by_compact.get(normalized_search.replace(" ", ""))
+        if not player_name:
+            # Otherwise take the best fuzzy match above the cutoff whose name parts also line up
+            candidates = process.extract(normalized_search, self.choices, scorer=fuzz.WRatio,
+                                         score_cutoff=PLAYER_MATCH_CUTOFF, limit=PLAYER_MATCH_CANDIDATES)
+            player_name = next((self.names[index] for choice, _, index in candidates
+                                if name_parts_agree(normalized_search, choice)), None)
+        
+        if len(self._matches) < PLAYER_MATCH_CACHE_SIZE:
+            self._matches[normalized_search] = player_name
+        return player_name
+
+async def read_until(response: aiohttp.ClientResponse, needle: bytes, tail: int) -> bytes:
+    """Read a response body only until needle has been seen plus tail more bytes.
+    
+    Falls back to at most READ_CAP_BYTES when the needle never appears. lxml recovers
+    from the tags left open by the truncation, so callers parse the result as usual.
+    """
+    body = bytearray()
+    stop_at = READ_CAP_BYTES
+    found = False
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        # Only the new bytes, plus overlap for a needle split across chunks, need searching
+        search_from = max(0, len(body) - len(needle) + 1)
+        body += chunk
+        if not found:
+            position = body.find(needle, search_from)
+            if position != -1:
+                found = True
+                stop_at = min(stop_at, position + len(needle) + tail)
+        if len(body) >= stop_at:
+            break
+    return bytes(body[:stop_at])
+
+def player_rank(stats: Dict[str, str]) -> int:
+    """Rank from a player's HashtagBasketball row, or 999 if it is missing or not a number"""
+    try:
+        return int(stats.get('R#', '999'))
+    except ValueError:
+        return 999
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live"""
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl  # Seconds an entry stays valid, None to never expire
+        self._entries: OrderedDict = OrderedDict()  # key -> (stored_at, value)
+        
+    def get(self, key):
+        """Return the cached value for key, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+
+@dataclass
+class EspnPlayerBundle:
+    """Everything parsed from one fetch of a player's ESPN page"""
+    player_name: str
+    player_id: str
+    team: str
+    news_time: Optional[str] = None
+    news_content: Optional[str] = None
+    analysis: Optional[str] = None
+    stats: Optional[Dict[str, str]] = None  # HashtagBasketball stats, if the name was resolved via rankings
+
+# Most important columns for fantasy basketball, in the order !players shows them
+PLAYER_TABLE_COLUMNS = [
+    'R#',        # Rank
+    'PLAYER',    # Player Name
+    'TEAM',      # Team
+    'POS',       # Position
+    'PTS',       # Points
+    'REB',       # Rebounds
+    'AST',       # Assists
+    'STL',       # Steals
+    'BLK',       # Blocks
+    'TO',        # Turnovers
+    'FG%',       # Field Goal %
+    '3PM',       # Three Pointers Made
+    'FT%'        # Free Throw %
+]
+RIGHT_ALIGNED_COLUMNS = frozenset({'PTS', 'REB', 'AST', 'STL', 'BLK', 'TO', '3PM'})  # Counting stats line up on the right
+
+def render_players_table(players: Dict[str, Dict[str, str]], prefix: str) -> List[str]:
+    """Render the !players listing as lines: a stats table, or a numbered list when players have no stats.
+    
+    Pure and synchronous so it can run in a worker thread.
+    """
+    # Build the full content first
+    content = []
+    
+    # If we have stats for players, create a formatted table
+    first_player_stats = next(iter(players.values()))
+    if first_player_stats:  # If we have stats
+        # Stat columns that exist in our data; rank and player name are handled separately
+        stat_columns = [col for col in PLAYER_TABLE_COLUMNS if col in first_player_stats and col not in ('R#', 'PLAYER')]
+    
+        # Format every cell once, then take column widths over the transposed cells
+        rows = [[str(stats.get(col, '')) for col in stat_columns] for stats in players.values()]
+        name_width = max(max(map(len, players)), len("PLAYER")) + 1  # Width for player names
+        stat_widths = [
+            max(max(map(len, column)), len(col)) + 1  # Widest value or header, plus minimal padding
+            for col, column in zip(stat_columns, zip(*rows))
+        ]
+    
+        # Create header line
+        header_line = f"{'#':>4} {'PLAYER':<{name_width}}"  # Rank width of 4 accommodates the period
+        for col, width in zip(stat_columns, stat_widths):
+            header_line += f" {col:^{width}}"
+    
+        # Create separator line
+        separator = "-" * len(header_line)
+    
+        # Add header to content
+        content.append(f"{prefix} (top {len(players)}):\n")
+        content.append(header_line)
+        content.append(separator)
+    
+        # One format string for every row: right-align numeric columns, center-align others
+        row_format = f"{{:>2}}. {{:<{name_width}}}" + "".join(
+            f" {{:{'>' if col in RIGHT_ALIGNED_COLUMNS else '^'}{width}}}"
+            for col, width in zip(stat_columns, stat_widths)
+        )
+    
+        # Add player rows; rankings are already in rank order
+        for i, (player_name, cells) in enumerate(zip(players, rows), 1):
+            content.append(row_format.format(i, player_name, *cells))
+    else:
+        # Simple numbered list for draft mode
+        content.append(f"{prefix} (top {len(players)}):\n")
+        for i, player_name in enumerate(players.keys(), 1):
+            content.append(f"{i:>3}. {player_name}")
+    
+    return content
+
+# Typical fantasy basketball roster slots per position
+ROSTER_REQUIREMENTS = {
+    Position.PG: 2,
+    Position.SG: 2,
+    Position.SF: 2,
+    Position.PF: 2,
+    Position.C: 2,
+    Position.UTIL: 3
+}
+
 class DraftState:
     def __init__(self, total_rounds: int, pick_position: int, total_players: int):
         self.total_rounds = total_rounds
@@ -56,7 +417,10 @@ class DraftState:
         self.picks_made = 0  # Track total picks made
         self.drafted_players: List[Tuple[str, Position]] = []  # List of (player, position) tuples
         self.my_team: List[Tuple[str, Position]] = []  # Track my drafted players and their positions
-        self.available_players = []
+        self.roster_counts: Counter = Counter()  # Position -> number of my players there, kept in step with my_team
+        self.available_players: Dict[str, None] = {}  # Insertion-ordered set of undrafted player names
+        self._summaries: Dict[str, str] = {}  # Prompt text derived from the state, cleared whenever a pick is recorded
+        self._views: Dict[str, Tuple[int, dict, List[str]]] = {}  # Command -> (picks_made, rankings snapshot, rendered replies)
         self.is_active = False
         
     def is_user_turn(self) -> bool:
@@ -67,39 +431,63 @@ class DraftState:
     
     def get_roster_needs(self) -> Dict[Position, int]:
         """Calculate roster needs based on typical fantasy basketball roster requirements"""
-        roster_requirements = {
-            Position.PG: 2,
-            Position.SG: 2,
-            Position.SF: 2,
-            Position.PF: 2,
-            Position.C: 2,
-            Position.UTIL: 3
-        }
-        
-        # Count current roster by position
-        current_roster = defaultdict(int)
-        for _, pos in self.my_team:
-            current_roster[pos] += 1
-            
-        # Calculate remaining needs
-        needs = {}
-        for pos, req in roster_requirements.items():
-            needs[pos] = max(0, req - current_roster[pos])
-            
-        return needs
+        return {pos: max(0, req - self.roster_counts[pos]) for pos, req in ROSTER_REQUIREMENTS.items()}
+    
+    def add_to_my_team(self, player: str, position: Position) -> None:
+        """Record one of my picks and count it toward its position"""
+        self.my_team.append((player, position))
+        self.roster_counts[position] += 1
+        self.invalidate_summaries()
+    
+    def invalidate_summaries(self) -> None:
+        """Drop cached summaries and rendered views after the draft state changes"""
+        self._summaries.clear()
+        self._views.clear()
+    
+    def cached_view(self, name: str, players: dict) -> Optional[List[str]]:
+        """Replies rendered earlier for this pick count and rankings snapshot, if any"""
+        view = self._views.get(name)
+        if view and view[0] == self.picks_made and view[1] is players:
+            return view[2]
+        return None
+    
+    def store_view(self, name: str, players: dict, responses: List[str]) -> None:
+        """Remember rendered replies until the next pick or rankings refresh"""
+        self._views[name] = (self.picks_made, players, responses)
+    
+    def needs_summary(self) -> str:
+        """Remaining roster needs as prompt text, rebuilt only after a pick"""
+        if "needs" not in self._summaries:
+            needs_lines = ["Current roster needs:"]
+            needs_lines.extend(f"• {pos.value}: {count} needed" for pos, count in self.get_roster_needs().items() if count > 0)
+            self._summaries["needs"] = "\n".join(needs_lines) + "\n"
+        return self._summaries["needs"]
+    
+    def team_summary(self) -> str:
+        """Comma-separated names of my drafted players, rebuilt only after a pick"""
+        if "team" not in self._summaries:
+            self._summaries["team"] = ', '.join(player for player, _ in self.my_team)
+        return self._summaries["team"]
+    
+    def top_available_summary(self, count: int = 10) -> str:
+        """Comma-separated top available players in rank order, rebuilt only after a pick"""
+        key = f"top{count}"
+        if key not in self._summaries:
+            self._summaries[key] = ", ".join(islice(self.available_players, count))
+        return self._summaries[key]
     
     def update_draft(self, drafted_player: str, position: Position) -> None:
         """Update draft state after a pick"""
         self.picks_made += 1
-        if drafted_player in self.available_players:
-            self.available_players.remove(drafted_player)
+        self.available_players.pop(drafted_player, None)
+        self.invalidate_summaries()
             
         # Record the pick
         self.drafted_players.append((drafted_player, position))
         
         # If it was our pick, add to my_team
         if self.is_user_turn():
-            self.my_team.append((drafted_player, position))
+            self.add_to_my_team(drafted_player, position)
             
         # Update round if necessary
         self.current_round = (self.picks_made // self.total_players) + 1
@@ -108,434 +496,544 @@ class DraftState:
         if self.picks_made >= (self.total_players * self.total_rounds):
             self.is_active = False
 
+# Known ESPN player IDs, checked before searching ESPN
+ESPN_PLAYER_IDS: Dict[str, str] = {
+    # Stars and All-Stars
+    "Nikola Jokic": "3112335",
+    "Shai Gilgeous-Alexander": "4278073",
+    "Victor Wembanyama": "5088141",
+    "Anthony Davis": "6583",
+    "Damian Lillard": "6606",
+    "Karl-Anthony Towns": "3136195",
+    "Kevin Durant": "3202",
+    "Stephen Curry": "3975",
+    "LeBron James": "1966",
+    "Luka Doncic": "3945274",
+    "Cade Cunningham": "4431687",
+    "James Harden": "3992",
+    "Tyrese Haliburton": "4395651",
+    "Jayson Tatum": "4065648",
+    "Kyrie Irving": "6442",
+    "Tyrese Maxey": "4431678",
+    "Devin Booker": "3136193",
+    "Domantas Sabonis": "3907387",
+    "Anthony Edwards": "4594268",
+    "Joel Embiid": "3059318",
+    "Jalen Johnson": "4433623",
+    "Trae Young": "4277905",
+    "Nikola Vucevic": "6478",
+    "Trey Murphy III": "4592458",
+    "Evan Mobley": "4432639",
+    "Jamal Murray": "3936299",
+    "Chet Holmgren": "4576173",
+    "John Collins": "3908845",
+    "Josh Hart": "3062679",
+    "Desmond Bane": "4397126",
+    "Jaren Jackson Jr.": "4277961",
+    "Franz Wagner": "4431682",
+    "Jalen Brunson": "3934672",
+    "Jalen Williams": "4683749",
+    "Tyler Herro": "4395625",
+    "Kristaps Porzingis": "3102531",
+    "Scottie Barnes": "4432816",
+    "De'Aaron Fox": "4066259",
+    "Darius Garland": "4395651",
+    "Zach LaVine": "2991043",
+    "Donovan Mitchell": "3908809",
+    "Walker Kessler": "4683750",
+    "LaMelo Ball": "4432816",
+    "Jordan Poole": "4277956",
+    "Jarrett Allen": "4066328",
+    "Derrick White": "3078576",
+    "Ivica Zubac": "3907822",
+    "Myles Turner": "3133628",
+    "Dyson Daniels": "4683751",
+    "Norman Powell": "2595516",
+    "Brandon Ingram": "3913176",
+    "Austin Reaves": "4431674",
+    "Jakob Poeltl": "3934673",
+    "Cameron Johnson": "3906663",
+    "Dejounte Murray": "3907497",
+    "Mark Williams": "4683752",
+    "Miles Bridges": "3908846",
+    "DeMar DeRozan": "3978",
+    "Bam Adebayo": "4066261",
+    "Pascal Siakam": "3149673",
+    "Brandon Miller": "4683753",
+    "Brook Lopez": "3470",
+    "Jimmy Butler": "6430",
+    "Giannis Antetokounmpo": "3032977",
+    "Amen Thompson": "4683754",
+    "Paul George": "4251",
+    "Malik Monk": "3934620",
+    "Jalen Duren": "4683755",
+    "Josh Giddey": "4683756",
+    "Ja Morant": "4279888",
+    "Christian Braun": "4683757",
+    "OG Anunoby": "3934719",
+    "Jalen Suggs": "4432640",
+    "Isaiah Hartenstein": "4066383",
+    "Coby White": "4395628",
+    "Cam Thomas": "4432641",
+    "Tari Eason": "4683758",
+    "Deandre Ayton": "4278129",
+    "Daniel Gafford": "4277952",
+    "Alperen Sengün": "4683759",
+    "Bradley Beal": "6580",
+    "Rudy Gobert": "3032976",
+    "Zion Williamson": "4395629",
+    "Jaylen Brown": "3917376",
+    "Michael Porter Jr.": "4065654",
+    "Chris Paul": "2779",
+    "Fred VanVleet": "2991230",
+    "Lauri Markkanen": "3136776",
+    "Payton Pritchard": "4397127",
+    "Julius Randle": "3064514",
+    "Jaden McDaniels": "4432642",
+    "Naz Reid": "4395630",
+    "Dereck Lively II": "4683760",
+    "Mikal Bridges": "3915195",
+    "Onyeka Okongwu": "4432643",
+    "Tobias Harris": "6440",
+    "Anfernee Simons": "4351852",
+    "P.J. Washington": "4277962",
+    "De'Andre Hunter": "4277963",
+    "Kawhi Leonard": "6450",
+    "Immanuel Quickley": "4397128",
+    "Collin Sexton": "4277964",
+    "Draymond Green": "6589",
+    "Andrew Wiggins": "3059319",
+    "Robert Williams III": "3922230",
+    "Kelly Oubre Jr.": "3133597",
+    "N'Faly Dante": "4683761",
+    "Keegan Murray": "4683762",
+    "Jalen Green": "4432644",
+    "Khris Middleton": "6609",
+    "Herbert Jones": "4432645",
+    "CJ McCollum": "6581",
+    "Goga Bitadze": "3908847",
+    "Grant Williams": "4397129",
+    "Toumani Camara": "4683763",
+    "Jonas Valanciunas": "6477",
+    "Santi Aldama": "4683764",
+    "Bobby Portis": "3064290",
+    "Devin Vassell": "4432646",
+    "Ty Jerome": "4277965",
+    "Keon Ellis": "4683765",
+    "Deni Avdija": "4432647",
+    "Daeqwon Plowden": "4683766",
+    "Donte DiVincenzo": "3934621",
+    "Ayo Dosunmu": "4432648",
+    "Jrue Holiday": "3995",
+    "Rui Hachimura": "4277966",
+    "Russell Westbrook": "3468",
+    "Zach Edey": "4683767",
+    "D'Angelo Russell": "3136776",
+    "Bennedict Mathurin": "4683768",
+    "Ben Simmons": "3907387",
+    "Cason Wallace": "4683769",
+    "Jaden Ivey": "4432649",
+    "Nicolas Claxton": "4277967",
+    "Tyus Jones": "3064515",
+    "Klay Thompson": "6475",
+    "Royce O'Neale": "2593118",
+    "Jerami Grant": "2991845",
+    "Keyonte George": "4683770",
+    "Shaedon Sharpe": "4683771",
+    "Kel'el Ware": "4683772",
+    "Ausar Thompson": "4683773",
+    "RJ Barrett": "4395627",
+    "Aaron Gordon": "3064290",
+    "Jose Alvarado": "4432650",
+    "Killian Hayes": "4432651",
+    "Luguentz Dort": "4397130",
+    "Andrew Nembhard": "4432652",
+    "Dennis Schröder": "3032979",
+    "Al Horford": "3213",
+    "Bilal Coulibaly": "4683774",
+    "Mike Conley": "3195",
+    "Jeremy Sochan": "4683775",
+    "Alex Caruso": "2991769",
+    "Guerschon Yabusele": "4066384",
+    "Jordan Clarkson": "2528779",
+    "Aaron Wiggins": "4432653",
+    "Naji Marshall": "4397131",
+    "Paolo Banchero": "4683776",
+    "Scoot Henderson": "4683777",
+    "Jared McCain": "4683778",
+    "Malik Beasley": "3907820",
+    "Kris Dunn": "3936300",
+    "Day'Ron Sharpe": "4432654",
+    "Grayson Allen": "3934674",
+    "Alexandre Sarr": "4683779",
+    "Nikola Jovic": "4683780",
+    "Lonzo Ball": "4066262",
+    "Nick Richards": "4432655",
+    "Aaron Nesmith": "4397132",
+    "Yves Missi": "4683781",
+    "T.J. McConnell": "2579458",
+    "Jabari Smith Jr.": "4683782",
+    "Isaiah Stewart": "4432656",
+    "Caris LeVert": "2991043",
+    "Larry Nance Jr.": "2991046",
+    "Jusuf Nurkic": "3102530",
+    "Richaun Holmes": "2991047",
+    "Kentavious Caldwell-Pope": "2528353",
+    "Malcolm Brogdon": "2566769",
+    "Donovan Clingan": "4683783",
+    "Luke Kennard": "3915196",
+    "Brandin Podziemski": "4683784",
+    "Gradey Dick": "4683785",
+    "Quentin Grimes": "4432657",
+    "Moritz Wagner": "3934675",
+    "Jaxson Hayes": "4277968",
+    "Dru Smith": "4432658",
+    "Ochai Agbaji": "4432659",
+    "Max Strus": "3915197",
+    "Julian Champagnie": "4432660",
+    "Brandon Clarke": "4277969",
+    "Tre Mann": "4432661",
+    "Obi Toppin": "4397133",
+    "Peyton Watson": "4683786",
+    "Cody Martin": "4066385",
+    "Derrick Jones Jr.": "3064516",
+    "Luke Kornet": "3136194",
+    "Max Christie": "4683787",
+    # Additional Players
+    "Scotty Pippen Jr.": "4433624",
+    "Dillon Brooks": "3059318",
+    "Buddy Hield": "2990984",
+    "Wendell Carter Jr.": "4066262",
+    "Bub Carrington": "4683788",
+    "Brandon Boston Jr.": "4433625",
+    "Clint Capela": "2991139",
+    "Ziaire Williams": "4433626",
+    "Justin Champagnie": "4433627",
+    "Jaylin Williams": "4433628",
+    "Duncan Robinson": "3934676",
+    "Precious Achiuwa": "4433629",
+    "Taylor Hendricks": "4683789",
+    "Gary Trent Jr.": "4277970",
+    "Jalen Smith": "4433630",
+    "Chris Boucher": "3912288",
+    "Haywood Highsmith": "4066386",
+    "De'Anthony Melton": "3908848",
+    "Kelly Olynyk": "2528353",
+    "Spencer Dinwiddie": "2580782",
+    "Marcus Smart": "2990992",
+    "Jordan Goodwin": "4433631",
+    "Taurean Prince": "3934677",
+    "Nickeil Alexander-Walker": "4277971",
+    "Harrison Barnes": "6578",
+    "Corey Kispert": "4433632",
+    "Terry Rozier": "3064517",
+    "Kyshawn George": "4683790",
+    "Dorian Finney-Smith": "2991769",
+    "Amir Coffey": "3934678",
+    "Miles McBride": "4433633",
+    "Jaylen Wells": "4683791",
+    "Quinten Post": "4683792",
+    "Keldon Johnson": "4277972",
+    "Caleb Martin": "3912289",
+    "Isaiah Joe": "4433634",
+    "Josh Okogie": "3908849",
+    "Georges Niang": "3136195",
+    "Thomas Bryant": "3908850",
+    "Keon Johnson": "4433635",
+    "Javonte Green": "3912290",
+    "Vít Krejcí": "4433636",
+    "Oscar Tshiebwe": "4683793",
+    "Patrick Williams": "4433637",
+    "Karlo Matkovic": "4683794",
+    "Jaime Jaquez Jr.": "4683795",
+    "Cole Anthony": "4433638",
+    "Mouhamed Gueye": "4683796",
+    "Elfrid Payton": "2583639",
+    "Davion Mitchell": "4433639",
+    "Jonathan Isaac": "3913177",
+    "Bol Bol": "4277973",
+    "Anthony Black": "4683797",
+    "Justin Edwards": "4683798",
+    "Zaccharie Risacher": "4683799",
+    "Mason Plumlee": "2579258",
+    "Jake LaRavia": "4683800",
+    "Bogdan Bogdanovic": "3032978",
+    "Noah Clowney": "4683801",
+    "Damion Baugh": "4433640",
+    "Kenyon Martin Jr.": "4433641",
+    "Trayce Jackson-Davis": "4683802",
+    "Tre Jones": "4433642",
+    "Sam Hauser": "4433643",
+    "Kevin Huerter": "3908851",
+    "Jay Huff": "4433644",
+    "Isaiah Jackson": "4433645",
+    "Jonathan Kuminga": "4433646",
+    "Stephon Castle": "4683803",
+    "Zach Collins": "3908852",
+    "Andre Drummond": "6585",
+    "Tim Hardaway Jr.": "2528210",
+    "Sam Merrill": "4433647",
+    "Brice Sensabaugh": "4683804",
+    "Matas Buzelis": "4683805",
+    "Kevin Porter Jr.": "4277974",
+    "AJ Green": "4433648",
+    "Moussa Diabate": "4683806",
+    "Josh Green": "4433649",
+    "Bismack Biyombo": "6427",
+    "Moses Moody": "4433650",
+    "Trendon Watford": "4433651",
+    "Dean Wade": "3912291",
+    "Paul Reed": "4433652",
+    "Tristan da Silva": "4683807",
+    "Julian Strawther": "4683808",
+    "Jordan Hawkins": "4683809",
+    "Daniel Theis": "3032980",
+    "Ben Sheppard": "4683810",
+    "Tosan Evbuomwan": "4683811",
+    "Garrison Mathews": "3912292",
+    "Isaiah Collier": "4683812",
+    "Bones Hyland": "4433653",
+    "Gary Payton II": "2991231",
+    "Kyle Filipowski": "4683813",
+    "Kevon Looney": "3064518",
+    "Keaton Wallace": "4683814",
+    "Svi Mykhailiuk": "3908853",
+    "Cameron Payne": "3064519",
+    "Kyle Lowry": "3012",
+    "Bruce Brown": "3908854",
+    "Mitchell Robinson": "3908855",
+    "Mo Bamba": "3908856",
+    "Charles Bassey": "4433654",
+    "Jonathan Mogbo": "4683815",
+    "Neemias Queta": "4433655",
+    "Trey Lyles": "3136196",
+    "Jarred Vanderbilt": "3908857",
+    "Dalton Knecht": "4683816",
+    "Dante Exum": "3059319",
+    "Ajay Mitchell": "4683817",
+    "Terance Mann": "3908858",
+    "Johnny Juzang": "4433656",
+    "Jeremiah Robinson-Earl": "4433657",
+    "Kenrich Williams": "2991232",
+    "Nicolas Batum": "3416",
+    "Jalen Wilson": "4683818",
+    "Kyle Anderson": "2993874",
+    "Eric Gordon": "3431",
+    "Moses Brown": "3912293",
+    "Vince Williams Jr.": "4683819",
+    "Isaac Okoro": "4433658",
+    "Jarace Walker": "4683820",
+    "Cam Whitmore": "4683821",
+    "Kyle Kuzma": "3134907",
+    "Dalano Banton": "4433659",
+    "Alec Burks": "6429",
+    "Tyrese Martin": "4433660",
+    "Drew Eubanks": "3912294",
+    "Micah Potter": "4433661",
+    "Marcus Sasser": "4683822",
+    "Quenton Jackson": "4683823",
+    "Ja'Kobe Walter": "4683824",
+    "Trevelin Queen": "4433662",
+    "Ryan Rollins": "4683825",
+    "David Roddy": "4683826",
+    "Jared Butler": "4433663",
+    "John Konchar": "3912295",
+    "Gabe Vincent": "3912296",
+    "DaQuan Jeffries": "3912297",
+    "Kevin Love": "3449",
+    "Tristan Vukcevic": "4683827",
+    "Torrey Craig": "2991233",
+    "Shake Milton": "3908859",
+    "Gui Santos": "4683828",
+    "Alondes Williams": "4683829",
+    "Jamal Shead": "4683830",
+    "Lonnie Walker IV": "3908860",
+    "KJ Simpson": "4683831",
+    "Kessler Edwards": "4433664",
+    "Ryan Dunn": "4683832",
+    "Seth Curry": "2326307",
+    "Jaylen Clark": "4683833",
+    "Andre Jackson Jr.": "4683834",
+    "Ron Holland II": "4683835",
+    "Nick Smith Jr.": "4683836",
+    "Jamison Battle": "4683837",
+    "Cam Reddish": "4277975",
+    "Brandon Williams": "4433665",
+    "Simone Fontecchio": "4683838",
+    "GG Jackson II": "4683839",
+    "Sandro Mamukelashvili": "4433666",
+    "Bruno Fernando": "3908861",
+    "Vasilije Micic": "4683840",
+    "Orlando Robinson": "4683841",
+    "Jabari Walker": "4683842",
+    "Pat Connaughton": "2993875",
+    "Ricky Council IV": "4683843",
+    "Lindy Waters III": "4433667",
+    "Jamaree Bouyea": "4433668",
+    "Josh Richardson": "2581190",
+    "Maxi Kleber": "3064520",
+    "Ousmane Dieng": "4683844",
+    "Wendell Moore Jr.": "4433669",
+    "DeAndre Jordan": "3442",
+    "Aaron Holiday": "3908862",
+    "Talen Horton-Tucker": "4277976",
+    "Yuri Collins": "4683845",
+    "Taj Gibson": "3986",
+    "Cam Spencer": "4683846",
+    "Jeff Green": "3209",
+    "Jaden Hardy": "4683847",
+    "Tidjane Salaun": "4683848",
+    "Craig Porter Jr.": "4683849",
+    "Adem Bona": "4683850",
+    "Terrence Shannon Jr.": "4433670",
+    "Monte Morris": "3059320",
+    "Alex Reese": "4683851",
+    "James Wiseman": "4433671",
+    "Kevin Knox II": "3908863",
+    "Reggie Jackson": "6443",
+    "Rob Dillingham": "4683852",
+    "Kai Jones": "4433672",
+    "Julian Phillips": "4683853",
+    "Collin Gillespie": "4433673",
+    "Zeke Nnaji": "4433674",
+    "Jordan Miller": "4683854",
+    "Jalen Hood-Schifino": "4683855",
+    "Dwight Powell": "2531367",
+    "Oso Ighodaro": "4683856"
+}
+
+# Normalized lookup tables so news requests don't rescan ESPN_PLAYER_IDS, built once at import
+ESPN_ID_BY_NORM: Dict[str, Tuple[str, str]] = {}  # Lowercased name -> (name, ESPN ID)
+ESPN_ID_BY_TOKEN: Dict[str, List[Tuple[str, str]]] = defaultdict(list)  # Name token -> [(name, ESPN ID)]
+for _name, _espn_id in ESPN_PLAYER_IDS.items():
+    ESPN_ID_BY_NORM[_name.lower()] = (_name, _espn_id)
+    for _token in _name.lower().split():
+        ESPN_ID_BY_TOKEN[_token].append((_name, _espn_id))
+del _name, _espn_id, _token
+
 class MistralAgent:
+    # Read-only view so no instance can mutate the shared ID map
+    ESPN_PLAYER_IDS = MappingProxyType(ESPN_PLAYER_IDS)
+    _instance: Optional["MistralAgent"] = None  # Process-wide agent returned by instance()
+    
+    @classmethod
+    def instance(cls) -> "MistralAgent":
+        """Return the shared agent, creating it on first use so its caches and HTTP session are never duplicated"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
         self.client = Mistral(api_key=MISTRAL_API_KEY)
-        self.channel_history: Dict[int, List[dict]] = defaultdict(list)
+        self.channel_history: Dict[int, deque] = defaultdict(lambda: deque(maxlen=MAX_HISTORY))  # Oldest messages drop off automatically
         self.draft_states: Dict[int, DraftState] = {}
-        self.cached_players: Dict[str, Dict[str, str]] = {}  # Map of player name to their attributes
-        self.last_fetch_time = 0  # Track when we last fetched players
-        self.ESPN_PLAYER_IDS = {
-            # Stars and All-Stars
-            "Nikola Jokic": "3112335",
-            "Shai Gilgeous-Alexander": "4278073",
-            "Victor Wembanyama": "5088141",
-            "Anthony Davis": "6583",
-            "Damian Lillard": "6606",
-            "Karl-Anthony Towns": "3136195",
-            "Kevin Durant": "3202",
-            "Stephen Curry": "3975",
-            "LeBron James": "1966",
-            "Luka Doncic": "3945274",
-            "Cade Cunningham": "4431687",
-            "James Harden": "3992",
-            "Tyrese Haliburton": "4395651",
-            "Jayson Tatum": "4065648",
-            "Kyrie Irving": "6442",
-            "Tyrese Maxey": "4431678",
-            "Devin Booker": "3136193",
-            "Domantas Sabonis": "3907387",
-            "Anthony Edwards": "4594268",
-            "Joel Embiid": "3059318",
-            "Jalen Johnson": "4433623",
-            "Trae Young": "4277905",
-            "Nikola Vucevic": "6478",
-            "Trey Murphy III": "4592458",
-            "Evan Mobley": "4432639",
-            "Jamal Murray": "3936299",
-            "Chet Holmgren": "4576173",
-            "John Collins": "3908845",
-            "Josh Hart": "3062679",
-            "Desmond Bane": "4397126",
-            "Jaren Jackson Jr.": "4277961",
-            "Franz Wagner": "4431682",
-            "Jalen Brunson": "3934672",
-            "Jalen Williams": "4683749",
-            "Tyler Herro": "4395625",
-            "Kristaps Porzingis": "3102531",
-            "Scottie Barnes": "4432816",
-            "De'Aaron Fox": "4066259",
-            "Darius Garland": "4395651",
-            "Zach LaVine": "2991043",
-            "Donovan Mitchell": "3908809",
-            "Walker Kessler": "4683750",
-            "LaMelo Ball": "4432816",
-            "Jordan Poole": "4277956",
-            "Jarrett Allen": "4066328",
-            "Derrick White": "3078576",
-            "Ivica Zubac": "3907822",
-            "Myles Turner": "3133628",
-            "Dyson Daniels": "4683751",
-            "Norman Powell": "2595516",
-            "Brandon Ingram": "3913176",
-            "Austin Reaves": "4431674",
-            "Jakob Poeltl": "3934673",
-            "Cameron Johnson": "3906663",
-            "Dejounte Murray": "3907497",
-            "Mark Williams": "4683752",
-            "Miles Bridges": "3908846",
-            "DeMar DeRozan": "3978",
-            "Bam Adebayo": "4066261",
-            "Pascal Siakam": "3149673",
-            "Brandon Miller": "4683753",
-            "Brook Lopez": "3470",
-            "Jimmy Butler": "6430",
-            "Giannis Antetokounmpo": "3032977",
-            "Amen Thompson": "4683754",
-            "Paul George": "4251",
-            "Malik Monk": "3934620",
-            "Jalen Duren": "4683755",
-            "Josh Giddey": "4683756",
-            "Ja Morant": "4279888",
-            "Christian Braun": "4683757",
-            "OG Anunoby": "3934719",
-            "Jalen Suggs": "4432640",
-            "Isaiah Hartenstein": "4066383",
-            "Coby White": "4395628",
-            "Cam Thomas": "4432641",
-            "Tari Eason": "4683758",
-            "Deandre Ayton": "4278129",
-            "Daniel Gafford": "4277952",
-            "Alperen Sengün": "4683759",
-            "Bradley Beal": "6580",
-            "Rudy Gobert": "3032976",
-            "Zion Williamson": "4395629",
-            "Jaylen Brown": "3917376",
-            "Michael Porter Jr.": "4065654",
-            "Chris Paul": "2779",
-            "Fred VanVleet": "2991230",
-            "Lauri Markkanen": "3136776",
-            "Payton Pritchard": "4397127",
-            "Julius Randle": "3064514",
-            "Jaden McDaniels": "4432642",
-            "Naz Reid": "4395630",
-            "Dereck Lively II": "4683760",
-            "Mikal Bridges": "3915195",
-            "Onyeka Okongwu": "4432643",
-            "Tobias Harris": "6440",
-            "Anfernee Simons": "4351852",
-            "P.J. Washington": "4277962",
-            "De'Andre Hunter": "4277963",
-            "Kawhi Leonard": "6450",
-            "Immanuel Quickley": "4397128",
-            "Collin Sexton": "4277964",
-            "Draymond Green": "6589",
-            "Andrew Wiggins": "3059319",
-            "Robert Williams III": "3922230",
-            "Kelly Oubre Jr.": "3133597",
-            "N'Faly Dante": "4683761",
-            "Keegan Murray": "4683762",
-            "Jalen Green": "4432644",
-            "Khris Middleton": "6609",
-            "Herbert Jones": "4432645",
-            "CJ McCollum": "6581",
-            "Goga Bitadze": "3908847",
-            "Grant Williams": "4397129",
-            "Toumani Camara": "4683763",
-            "Jonas Valanciunas": "6477",
-            "Santi Aldama": "4683764",
-            "Bobby Portis": "3064290",
-            "Devin Vassell": "4432646",
-            "Ty Jerome": "4277965",
-            "Keon Ellis": "4683765",
-            "Deni Avdija": "4432647",
-            "Daeqwon Plowden": "4683766",
-            "Donte DiVincenzo": "3934621",
-            "Ayo Dosunmu": "4432648",
-            "Jrue Holiday": "3995",
-            "Rui Hachimura": "4277966",
-            "Russell Westbrook": "3468",
-            "Zach Edey": "4683767",
-            "D'Angelo Russell": "3136776",
-            "Bennedict Mathurin": "4683768",
-            "Ben Simmons": "3907387",
-            "Cason Wallace": "4683769",
-            "Jaden Ivey": "4432649",
-            "Nicolas Claxton": "4277967",
-            "Tyus Jones": "3064515",
-            "Klay Thompson": "6475",
-            "Royce O'Neale": "2593118",
-            "Jerami Grant": "2991845",
-            "Keyonte George": "4683770",
-            "Shaedon Sharpe": "4683771",
-            "Kel'el Ware": "4683772",
-            "Ausar Thompson": "4683773",
-            "RJ Barrett": "4395627",
-            "Aaron Gordon": "3064290",
-            "Jose Alvarado": "4432650",
-            "Killian Hayes": "4432651",
-            "Luguentz Dort": "4397130",
-            "Andrew Nembhard": "4432652",
-            "Dennis Schröder": "3032979",
-            "Al Horford": "3213",
-            "Bilal Coulibaly": "4683774",
-            "Mike Conley": "3195",
-            "Jeremy Sochan": "4683775",
-            "Alex Caruso": "2991769",
-            "Guerschon Yabusele": "4066384",
-            "Jordan Clarkson": "2528779",
-            "Aaron Wiggins": "4432653",
-            "Naji Marshall": "4397131",
-            "Paolo Banchero": "4683776",
-            "Scoot Henderson": "4683777",
-            "Jared McCain": "4683778",
-            "Malik Beasley": "3907820",
-            "Kris Dunn": "3936300",
-            "Day'Ron Sharpe": "4432654",
-            "Grayson Allen": "3934674",
-            "Alexandre Sarr": "4683779",
-            "Nikola Jovic": "4683780",
-            "Lonzo Ball": "4066262",
-            "Nick Richards": "4432655",
-            "Aaron Nesmith": "4397132",
-            "Yves Missi": "4683781",
-            "T.J. McConnell": "2579458",
-            "Jabari Smith Jr.": "4683782",
-            "Isaiah Stewart": "4432656",
-            "Caris LeVert": "2991043",
-            "Larry Nance Jr.": "2991046",
-            "Jusuf Nurkic": "3102530",
-            "Richaun Holmes": "2991047",
-            "Kentavious Caldwell-Pope": "2528353",
-            "Malcolm Brogdon": "2566769",
-            "Donovan Clingan": "4683783",
-            "Luke Kennard": "3915196",
-            "Brandin Podziemski": "4683784",
-            "Gradey Dick": "4683785",
-            "Quentin Grimes": "4432657",
-            "Moritz Wagner": "3934675",
-            "Jaxson Hayes": "4277968",
-            "Dru Smith": "4432658",
-            "Ochai Agbaji": "4432659",
-            "Max Strus": "3915197",
-            "Julian Champagnie": "4432660",
-            "Brandon Clarke": "4277969",
-            "Tre Mann": "4432661",
-            "Obi Toppin": "4397133",
-            "Peyton Watson": "4683786",
-            "Cody Martin": "4066385",
-            "Derrick Jones Jr.": "3064516",
-            "Luke Kornet": "3136194",
-            "Max Christie": "4683787",
-            # Additional Players
-            "Scotty Pippen Jr.": "4433624",
-            "Dillon Brooks": "3059318",
-            "Buddy Hield": "2990984",
-            "Wendell Carter Jr.": "4066262",
-            "Bub Carrington": "4683788",
-            "Brandon Boston Jr.": "4433625",
-            "Clint Capela": "2991139",
-            "Ziaire Williams": "4433626",
-            "Justin Champagnie": "4433627",
-            "Jaylin Williams": "4433628",
-            "Duncan Robinson": "3934676",
-            "Precious Achiuwa": "4433629",
-            "Taylor Hendricks": "4683789",
-            "Gary Trent Jr.": "4277970",
-            "Jalen Smith": "4433630",
-            "Chris Boucher": "3912288",
-            "Haywood Highsmith": "4066386",
-            "De'Anthony Melton": "3908848",
-            "Kelly Olynyk": "2528353",
-            "Spencer Dinwiddie": "2580782",
-            "Marcus Smart": "2990992",
-            "Jordan Goodwin": "4433631",
-            "Taurean Prince": "3934677",
-            "Nickeil Alexander-Walker": "4277971",
-            "Harrison Barnes": "6578",
-            "Corey Kispert": "4433632",
-            "Terry Rozier": "3064517",
-            "Kyshawn George": "4683790",
-            "Dorian Finney-Smith": "2991769",
-            "Amir Coffey": "3934678",
-            "Miles McBride": "4433633",
-            "Jaylen Wells": "4683791",
-            "Quinten Post": "4683792",
-            "Keldon Johnson": "4277972",
-            "Caleb Martin": "3912289",
-            "Isaiah Joe": "4433634",
-            "Josh Okogie": "3908849",
-            "Georges Niang": "3136195",
-            "Thomas Bryant": "3908850",
-            "Keon Johnson": "4433635",
-            "Javonte Green": "3912290",
-            "Vít Krejcí": "4433636",
-            "Oscar Tshiebwe": "4683793",
-            "Patrick Williams": "4433637",
-            "Karlo Matkovic": "4683794",
-            "Jaime Jaquez Jr.": "4683795",
-            "Cole Anthony": "4433638",
-            "Mouhamed Gueye": "4683796",
-            "Elfrid Payton": "2583639",
-            "Davion Mitchell": "4433639",
-            "Jonathan Isaac": "3913177",
-            "Bol Bol": "4277973",
-            "Anthony Black": "4683797",
-            "Justin Edwards": "4683798",
-            "Zaccharie Risacher": "4683799",
-            "Mason Plumlee": "2579258",
-            "Jake LaRavia": "4683800",
-            "Bogdan Bogdanovic": "3032978",
-            "Noah Clowney": "4683801",
-            "Damion Baugh": "4433640",
-            "Kenyon Martin Jr.": "4433641",
-            "Trayce Jackson-Davis": "4683802",
-            "Tre Jones": "4433642",
-            "Sam Hauser": "4433643",
-            "Kevin Huerter": "3908851",
-            "Jay Huff": "4433644",
-            "Isaiah Jackson": "4433645",
-            "Jonathan Kuminga": "4433646",
-            "Stephon Castle": "4683803",
-            "Zach Collins": "3908852",
-            "Andre Drummond": "6585",
-            "Tim Hardaway Jr.": "2528210",
-            "Sam Merrill": "4433647",
-            "Brice Sensabaugh": "4683804",
-            "Matas Buzelis": "4683805",
-            "Kevin Porter Jr.": "4277974",
-            "AJ Green": "4433648",
-            "Moussa Diabate": "4683806",
-            "Josh Green": "4433649",
-            "Bismack Biyombo": "6427",
-            "Moses Moody": "4433650",
-            "Trendon Watford": "4433651",
-            "Dean Wade": "3912291",
-            "Paul Reed": "4433652",
-            "Tristan da Silva": "4683807",
-            "Julian Strawther": "4683808",
-            "Jordan Hawkins": "4683809",
-            "Daniel Theis": "3032980",
-            "Ben Sheppard": "4683810",
-            "Tosan Evbuomwan": "4683811",
-            "Garrison Mathews": "3912292",
-            "Isaiah Collier": "4683812",
-            "Bones Hyland": "4433653",
-            "Gary Payton II": "2991231",
-            "Kyle Filipowski": "4683813",
-            "Kevon Looney": "3064518",
-            "Keaton Wallace": "4683814",
-            "Svi Mykhailiuk": "3908853",
-            "Cameron Payne": "3064519",
-            "Kyle Lowry": "3012",
-            "Bruce Brown": "3908854",
-            "Mitchell Robinson": "3908855",
-            "Mo Bamba": "3908856",
-            "Charles Bassey": "4433654",
-            "Jonathan Mogbo": "4683815",
-            "Neemias Queta": "4433655",
-            "Trey Lyles": "3136196",
-            "Jarred Vanderbilt": "3908857",
-            "Dalton Knecht": "4683816",
-            "Dante Exum": "3059319",
-            "Ajay Mitchell": "4683817",
-            "Terance Mann": "3908858",
-            "Johnny Juzang": "4433656",
-            "Jeremiah Robinson-Earl": "4433657",
-            "Kenrich Williams": "2991232",
-            "Nicolas Batum": "3416",
-            "Jalen Wilson": "4683818",
-            "Kyle Anderson": "2993874",
-            "Eric Gordon": "3431",
-            "Moses Brown": "3912293",
-            "Vince Williams Jr.": "4683819",
-            "Isaac Okoro": "4433658",
-            "Jarace Walker": "4683820",
-            "Cam Whitmore": "4683821",
-            "Kyle Kuzma": "3134907",
-            "Dalano Banton": "4433659",
-            "Alec Burks": "6429",
-            "Tyrese Martin": "4433660",
-            "Drew Eubanks": "3912294",
-            "Micah Potter": "4433661",
-            "Marcus Sasser": "4683822",
-            "Quenton Jackson": "4683823",
-            "Ja'Kobe Walter": "4683824",
-            "Trevelin Queen": "4433662",
-            "Ryan Rollins": "4683825",
-            "David Roddy": "4683826",
-            "Jared Butler": "4433663",
-            "John Konchar": "3912295",
-            "Gabe Vincent": "3912296",
-            "DaQuan Jeffries": "3912297",
-            "Kevin Love": "3449",
-            "Tristan Vukcevic": "4683827",
-            "Torrey Craig": "2991233",
-            "Shake Milton": "3908859",
-            "Gui Santos": "4683828",
-            "Alondes Williams": "4683829",
-            "Jamal Shead": "4683830",
-            "Lonnie Walker IV": "3908860",
-            "KJ Simpson": "4683831",
-            "Kessler Edwards": "4433664",
-            "Ryan Dunn": "4683832",
-            "Seth Curry": "2326307",
-            "Jaylen Clark": "4683833",
-            "Andre Jackson Jr.": "4683834",
-            "Ron Holland II": "4683835",
-            "Nick Smith Jr.": "4683836",
-            "Jamison Battle": "4683837",
-            "Cam Reddish": "4277975",
-            "Brandon Williams": "4433665",
-            "Simone Fontecchio": "4683838",
-            "GG Jackson II": "4683839",
-            "Sandro Mamukelashvili": "4433666",
-            "Bruno Fernando": "3908861",
-            "Vasilije Micic": "4683840",
-            "Orlando Robinson": "4683841",
-            "Jabari Walker": "4683842",
-            "Pat Connaughton": "2993875",
-            "Ricky Council IV": "4683843",
-            "Lindy Waters III": "4433667",
-            "Jamaree Bouyea": "4433668",
-            "Josh Richardson": "2581190",
-            "Maxi Kleber": "3064520",
-            "Ousmane Dieng": "4683844",
-            "Wendell Moore Jr.": "4433669",
-            "DeAndre Jordan": "3442",
-            "Aaron Holiday": "3908862",
-            "Talen Horton-Tucker": "4277976",
-            "Yuri Collins": "4683845",
-            "Taj Gibson": "3986",
-            "Cam Spencer": "4683846",
-            "Jeff Green": "3209",
-            "Jaden Hardy": "4683847",
-            "Tidjane Salaun": "4683848",
-            "Craig Porter Jr.": "4683849",
-            "Adem Bona": "4683850",
-            "Terrence Shannon Jr.": "4433670",
-            "Monte Morris": "3059320",
-            "Alex Reese": "4683851",
-            "James Wiseman": "4433671",
-            "Kevin Knox II": "3908863",
-            "Reggie Jackson": "6443",
-            "Rob Dillingham": "4683852",
-            "Kai Jones": "4433672",
-            "Julian Phillips": "4683853",
-            "Collin Gillespie": "4433673",
-            "Zeke Nnaji": "4433674",
-            "Jordan Miller": "4683854",
-            "Jalen Hood-Schifino": "4683855",
-            "Dwight Powell": "2531367",
-            "Oso Ighodaro": "4683856"
-        }
+        self.players_cache = TTLCache(1, PLAYERS_CACHE_TTL)  # Holds the current player name -> attributes map
+        self._rankings_table: Tuple[Optional[dict], List[str]] = (None, [])  # Rankings snapshot and its rendered !players table
+        self._players_lock = asyncio.Lock()  # Serializes rankings refreshes so concurrent requests don't all re-scrape
+        self._name_index: Optional[PlayerNameIndex] = None  # Normalized names for the current rankings snapshot
+        self.search_cache = TTLCache(WEB_SEARCH_CACHE_SIZE, WEB_SEARCH_CACHE_TTL)  # Normalized query -> result
+        self.news_cache = TTLCache(NEWS_CACHE_SIZE, NEWS_CACHE_TTL)  # Normalized player name -> news messages
+        self.scrape_cache = TTLCache(SCRAPE_CACHE_SIZE, SCRAPE_CACHE_TTL)  # Normalized player name -> Basketball Reference news
+        self.recommendation_cache = TTLCache(RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL)  # SHA-256 of draft prompt -> recommendation messages
+        self.espn_id_cache = TTLCache(ESPN_ID_CACHE_SIZE)  # Normalized player name -> ESPN ID, never expires
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared HTTP session, created on first use
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}  # Host -> cap on concurrent requests to it
+        self._warm_task: Optional[asyncio.Task] = None  # Background news cache warm-up
+        self._refresh_task: Optional[asyncio.Task] = None  # Background rankings refresh
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps connections to HashtagBasketball, ESPN and Basketball
+        Reference alive between requests instead of paying a new TCP/TLS handshake each time.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=HOST_MAX_CONCURRENCY, keepalive_timeout=30, ttl_dns_cache=300),
+                headers=SESSION_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def _fetch(self, url: str, **kwargs):
+        """GET url over the shared session while holding one of its host's concurrency slots.
+        
+        Keeps gather fan-out from flooding a single site into rate limits and timeouts.
+        """
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(HOST_MAX_CONCURRENCY)
+        session = await self._get_session()
+        async with semaphore, session.get(url, **kwargs) as response:
+            yield response
+
+    async def _fetch_page(self, url: str, needle: Optional[bytes] = None, tail: int = 0, **kwargs) -> Optional[bytes]:
+        """Body of a successful GET, read only up to needle plus tail bytes when given; None on a non-200 status.
+        
+        Owns its _fetch context, so concurrent page fetches each release their host slot themselves.
+        """
+        async with self._fetch(url, **kwargs) as response:
+            if response.status != 200:
+                return None
+            if needle is not None:
+                return await read_until(response, needle, tail)
+            return await response.read()
+
+    async def start(self):
+        """Start background tasks; safe to call again on reconnect."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_players_loop())
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = asyncio.create_task(self._warm_news_cache())
+
+    async def _refresh_players_loop(self, interval: int = PLAYERS_REFRESH_INTERVAL):
+        """Keep the rankings cache warm so commands never wait on the scrape.
+        
+        Requests that arrive during a refresh wait on the rankings lock and reuse its result.
+        """
+        while True:
+            try:
+                players = await self._get_players(force_refresh=True)
+                logger.info(f"Refreshed rankings in the background ({len(players)} players)")
+            except Exception as e:
+                logger.error(f"Error refreshing player rankings: {str(e)}")
+            await asyncio.sleep(interval)
+
+    async def _warm_news_cache(self, top_n: int = NEWS_WARM_PLAYERS, interval: int = NEWS_WARM_INTERVAL):
+        """Periodically prefetch news for the top-ranked players so first requests hit the cache."""
+        while True:
+            try:
+                players = await self._get_players()
+                # Rankings are stored in page order, so the first entries are the top players
+                top_players = list(players)[:top_n]
+                # Refetch even fresh entries so each warm-up restarts their TTL before it lapses
+                await self.get_player_news_batch(top_players, refresh=True)
+                logger.info(f"Warmed news cache for {len(top_players)} players")
+            except Exception as e:
+                logger.error(f"Error warming news cache: {str(e)}")
+            await asyncio.sleep(interval)
+
+    async def aclose(self):
+        """Stop background tasks and close the shared HTTP session."""
+        for task in (self._refresh_task, self._warm_task):
+            if task:
+                task.cancel()
+        if self._session:
+            await self._session.close()
 
     def _update_history(self, channel_id: int, role: str, content: str):
-        """Add a message to the channel's history and maintain history size."""
+        """Add a message to the channel's history; the deque keeps only the last MAX_HISTORY."""
         self.channel_history[channel_id].append({"role": role, "content": content})
-        # Keep only the last MAX_HISTORY messages
-        if len(self.channel_history[channel_id]) > MAX_HISTORY:
-            self.channel_history[channel_id] = self.channel_history[channel_id][-MAX_HISTORY:]
 
     async def run(self, message: discord.Message):
         # Get the channel's conversation history
         channel_id = message.channel.id
         
         # Construct messages list with system prompt and history
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-        messages.extend(self.channel_history[channel_id])
-        messages.append({"role": "user", "content": message.content})
+        messages = [SYSTEM_MESSAGE, *self.channel_history[channel_id], {"role": "user", "content": message.content}]
 
         # Get response from Mistral
         response = await self.client.chat.complete_async(
@@ -551,126 +1049,72 @@ class MistralAgent:
         # Add block quote formatting
         return f">>> {response_content}"
 
+    async def _stream_completion(self, messages: List[dict], on_update: Optional[Callable[[str], Awaitable[None]]] = None) -> str:
+        """Stream a chat completion, passing the text so far to on_update at most every STREAM_UPDATE_INTERVAL seconds.
+        
+        Returns:
+            The full response text
+        """
+        parts = []
+        last_update = time.monotonic()
+        stream = await self.client.chat.stream_async(model=MISTRAL_MODEL, messages=messages)
+        async for event in stream:
+            if not event.data.choices:
+                continue
+            content = event.data.choices[0].delta.content
+            if not isinstance(content, str) or not content:
+                continue
+            parts.append(content)
+            if on_update and time.monotonic() - last_update >= STREAM_UPDATE_INTERVAL:
+                await on_update("".join(parts))
+                last_update = time.monotonic()
+        return "".join(parts)
+
+    def _cache_players(self, players: Dict[str, Dict[str, str]]) -> None:
+        """Store a rankings snapshot and build its name index once, up front"""
+        self.players_cache.set(PLAYERS_CACHE_KEY, players)
+        if players:
+            self._name_index = PlayerNameIndex(players)
+        
+    def _get_name_index(self, players_map: Dict[str, Dict[str, str]]) -> PlayerNameIndex:
+        """Return the name index for a rankings snapshot, rebuilding it only when the snapshot changes."""
+        if self._name_index is None or self._name_index.players_map is not players_map:
+            self._name_index = PlayerNameIndex(players_map)
+        return self._name_index
+
     def _find_player_match(self, search_name: str, players_map: Dict[str, Dict[str, str]]) -> Optional[Tuple[str, Dict[str, str]]]:
         """Find the best match for a player name in the players map."""
-        def normalize_name(name: str) -> str:
-            """Normalize a name by removing special characters and converting to lowercase"""
-            # Remove periods, apostrophes, and other special characters
-            name = ''.join(c for c in name if c.isalnum() or c.isspace())
-            return name.lower().strip()
-        
-        def split_name(name: str) -> str:
-            """Split a name that might be camelCase or PascalCase"""
-            # Common prefixes to handle
-            prefixes = ["Mc", "Mac", "De", "Van", "Von", "St", "O", "Le", "La", "Al"]
-            
-            # First try to split on capital letters
-            parts = []
-            current = []
-            for i, char in enumerate(name):
-                if i > 0 and char.isupper():
-                    # Check if it's part of a prefix
-                    current_word = "".join(current)
-                    next_chars = name[i:i+3] if i+3 <= len(name) else name[i:]
-                    is_prefix = False
-                    for prefix in prefixes:
-                        if (current_word + next_chars).startswith(prefix):
-                            is_prefix = True
-                            break
-                    
-                    if not is_prefix:
-                        parts.append("".join(current))
-                        current = []
-                current.append(char)
-            parts.append("".join(current))
-            
-            return " ".join(parts)
-        
-        # Clean and prepare search name
-        search_name = search_name.strip()
-        if " " not in search_name:
-            search_name = split_name(search_name)
-        normalized_search = normalize_name(search_name)
-        search_parts = normalized_search.split()
-        
-        # Try exact match first
-        for player_name, stats in players_map.items():
-            if normalize_name(player_name) == normalized_search:
-                return (player_name, stats)
-        
-        # Try matching first and last name
-        if len(search_parts) > 1:
-            for player_name, stats in players_map.items():
-                normalized_player = normalize_name(player_name)
-                player_parts = normalized_player.split()
-                if len(player_parts) > 1:
-                    # Match both first and last name
-                    if (search_parts[0] in player_parts[0] and 
-                        search_parts[-1] in player_parts[-1]):
-                        return (player_name, stats)
-        
-        # Try matching without spaces
-        no_space_search = "".join(search_parts)
-        for player_name, stats in players_map.items():
-            no_space_player = "".join(normalize_name(player_name).split())
-            if no_space_search in no_space_player:
-                return (player_name, stats)
-        
-        # Try partial matches with score-based ranking
-        best_match = None
-        best_score = 0
-        for player_name, stats in players_map.items():
-            normalized_player = normalize_name(player_name)
-            player_parts = normalized_player.split()
-            
-            # Calculate match score
-            score = 0
-            for search_part in search_parts:
-                # Full word match
-                if search_part in player_parts:
-                    score += 3
-                # Partial word match
-                elif any(search_part in part for part in player_parts):
-                    score += 1
-                    
-            if score > best_score:
-                best_score = score
-                best_match = (player_name, stats)
-        
-        # Only return partial matches if they have a minimum score
-        if best_score >= 2:
-            return best_match
-            
+        player_name = self._get_name_index(players_map).match(normalize_name(search_name))
+        if player_name:
+            return (player_name, players_map[player_name])
         return None
 
-    async def compare_players(self, players: List[str]) -> List[str]:
-        """Compare NBA players for fantasy basketball purposes."""
+    async def compare_players(self, players: List[str], on_update: Optional[Callable[[str], Awaitable[None]]] = None) -> List[str]:
+        """Compare NBA players for fantasy basketball purposes.
+        
+        Args:
+            players: Player names to compare
+            on_update: Optional coroutine called with the partial analysis while it streams in
+        """
         if len(players) < 2:
             return [">>> Please provide at least 2 players to compare."]
             
         players_str = ", ".join(players)
         
-        # First get current rankings from HashtagBasketball
-        current_time = int(time.time())
-        if not self.cached_players or (current_time - self.last_fetch_time) > 3600:
-            self.cached_players = await self.fetch_players_list()
-            self.last_fetch_time = current_time
+        # First get current rankings from HashtagBasketball; keep this snapshot for the whole comparison
+        players_map = await self._get_players()
             
         # Get rankings for requested players with better name matching
         player_rankings = {}
         unmatched_players = []
         for player in players:
-            match = self._find_player_match(player, self.cached_players)
+            match = self._find_player_match(player, players_map)
             if match:
                 player_name, stats = match
-                try:
-                    rank = int(stats.get('RANK', '999'))
-                except ValueError:
-                    rank = 999
                 player_rankings[player] = {
                     "exact_name": player_name,
                     "stats": stats,
-                    "rank": rank,
+                    "rank": stats['R#'],  # Parsed to int when the rankings were fetched
                     "injury_status": "Unknown"
                 }
             else:
@@ -681,74 +1125,81 @@ class MistralAgent:
             unmatched_str = ", ".join(unmatched_players)
             logger.warning(f"Could not find rankings for players: {unmatched_str}")
                 
-        # Get current injury/news info for each player and update rankings
+        # Check all players for season-ending injuries concurrently
+        season_ending_results = await asyncio.gather(*[
+            self.web_search(f"{player} NBA season ending injury 2024-25 out for season") for player in players
+        ])
+        season_ending_flags = [reports_season_ending(result) for result in season_ending_results]
+        
+        # Only players who can still play need current injury and performance searches
+        active_players = [player for player, season_ending in zip(players, season_ending_flags) if not season_ending]
+        searches = []
+        for player in active_players:
+            searches.append(f"{player} NBA injury status March 2025 current")  # Current injury status and news
+            searches.append(f"{player} NBA fantasy basketball performance March 2025")  # Recent performance
+        search_responses = await asyncio.gather(*[self.web_search(search) for search in searches])
+        follow_up_results = {player: search_responses[2 * i:2 * i + 2] for i, player in enumerate(active_players)}
+        
+        # Update rankings with each player's search results
         search_results = []
-        for player in players:
-            # First search specifically for season-ending injuries
-            season_ending_search = f"{player} NBA season ending injury 2024-25 out for season"
-            season_ending_result = await self.web_search(season_ending_search)
-            
-            # Then search for current injury status and news
-            injury_search = f"{player} NBA injury status March 2025 current"
-            injury_result = await self.web_search(injury_search)
-            
-            # Finally get recent performance
-            performance_search = f"{player} NBA fantasy basketball performance March 2025"
-            performance_result = await self.web_search(performance_search)
+        for player, season_ending_result, season_ending in zip(players, season_ending_results, season_ending_flags):
+            injury_result, performance_result = (None, None) if season_ending else follow_up_results[player]
             
             # Combine with HashtagBasketball data if available
-            player_info = "Current Status:\n"
+            player_info = ["Current Status:\n"]
             if player in player_rankings:
                 exact_name = player_rankings[player]["exact_name"]
                 stats = player_rankings[player]["stats"]
-                player_info += f"HashtagBasketball Rankings (as {exact_name}):\n"
-                for stat, value in stats.items():
-                    player_info += f"- {stat}: {value}\n"
+                player_info.append(f"HashtagBasketball Rankings (as {exact_name}):\n")
+                player_info.extend(f"- {stat}: {value}\n" for stat, value in stats.items())
                 
                 # Update player's injury status
-                if "season" in season_ending_result.lower() and "ending" in season_ending_result.lower():
+                if season_ending:
                     player_rankings[player]["injury_status"] = "Season-Ending"
                     player_rankings[player]["rank"] = 9999  # Force to bottom
-                elif any(term in injury_result.lower() for term in ["out indefinitely", "out for", "expected to miss", "several weeks"]):
+                elif LONG_TERM_RE.search(injury_result):
                     player_rankings[player]["injury_status"] = "Long-Term"
                     player_rankings[player]["rank"] += 50  # Significantly lower ranking
-                elif any(term in injury_result.lower() for term in ["day-to-day", "questionable", "probable"]):
+                elif DAY_TO_DAY_RE.search(injury_result):
                     player_rankings[player]["injury_status"] = "Day-to-Day"
                     # Keep original ranking mostly intact
                 else:
                     player_rankings[player]["injury_status"] = "Healthy"
             else:
-                player_info += "Not found in current HashtagBasketball rankings\n"
+                player_info.append("Not found in current HashtagBasketball rankings\n")
             
-            player_info += f"\nSeason-Ending Injury Check:\n{season_ending_result}\n"
-            player_info += f"\nCurrent Injury Status:\n{injury_result}\n"
-            player_info += f"\nRecent Performance:\n{performance_result}"
+            if season_ending:
+                # Ranked last regardless, so a short notice is all the model needs
+                player_info.append(f"\nSTATUS: Out for season\n{season_ending_result[:SEASON_ENDING_INFO_CHARS]}")
+            else:
+                player_info.append(f"\nSeason-Ending Injury Check:\n{season_ending_result}\n")
+                player_info.append(f"\nCurrent Injury Status:\n{injury_result}\n")
+                player_info.append(f"\nRecent Performance:\n{performance_result}")
             
-            search_results.append(f"Information for {player}:\n{player_info}\n")
+            search_results.append(f"Information for {player}:\n{''.join(player_info)}\n")
         
         # Sort players by adjusted rank (considering injuries)
-        sorted_players = sorted(
-            [(p, info) for p, info in player_rankings.items()],
-            key=lambda x: x[1]["rank"]
-        )
+        sorted_players = [(info["rank"], player, info) for player, info in player_rankings.items()]
+        sorted_players.sort(key=itemgetter(0))
         
         # Create ranking summary
-        ranking_summary = "\nFinal Rankings (considering injuries):\n"
-        for i, (player, info) in enumerate(sorted_players, 1):
+        ranking_lines = ["\nFinal Rankings (considering injuries):\n"]
+        for i, (_, player, info) in enumerate(sorted_players, 1):
             status = f" ({info['injury_status']})" if info['injury_status'] != "Healthy" else ""
-            ranking_summary += f"{i}. {info['exact_name']}{status}\n"
+            ranking_lines.append(f"{i}. {info['exact_name']}{status}\n")
+        ranking_summary = "".join(ranking_lines)
         
+        # Only the player information and names change between calls; concatenate once
+        current_info = "\n".join(search_results) + ranking_summary
         messages = [
-            {"role": "system", "content": COMPARE_PROMPT.format(
-                current_info="\n".join(search_results) + ranking_summary,
-                players=players_str
-            )}
+            {"role": "system", "content": "".join((
+                COMPARE_PROMPT_PREFIX,
+                current_info,
+                COMPARE_PROMPT_SUFFIX.format(players=players_str)
+            ))}
         ]
 
-        response = await self.client.chat.complete_async(
-            model=MISTRAL_MODEL,
-            messages=messages,
-        )
+        analysis = await self._stream_completion(messages, on_update)
 
         # Format final response with consistent styling
         sections = []
@@ -759,7 +1210,7 @@ class MistralAgent:
         sections.append(f"{'='*50}")
         
         # Main comparison content
-        sections.append(f"\n{response.choices[0].message.content}")
+        sections.append(f"\n{analysis}")
         
         # Footer
         sections.append(f"\n{'='*50}")
@@ -780,23 +1231,29 @@ class MistralAgent:
         Returns:
             Dict mapping player names to their attributes
         """
-        current_time = int(time.time())
-        
         # Use cache if available and less than 1 hour old, unless force refresh is requested
-        if not force_refresh and self.cached_players and (current_time - self.last_fetch_time) <= 3600:
+        cached_players = None if force_refresh else self.players_cache.get(PLAYERS_CACHE_KEY)
+        if cached_players:
             logger.info("Using cached player rankings")
-            return self.cached_players
+            return cached_players
             
-        # Fetch fresh data
-        logger.info("Fetching fresh player rankings")
-        players = await self.fetch_players_list()
-        
-        # Update cache if fetch was successful
-        if players:
-            self.cached_players = players
-            self.last_fetch_time = current_time
+        # Only one task refreshes at a time; the rest wait and reuse its result
+        async with self._players_lock:
+            if not force_refresh:
+                cached_players = self.players_cache.get(PLAYERS_CACHE_KEY)
+                if cached_players:
+                    logger.info("Using player rankings refreshed by another request")
+                    return cached_players
+            
+            # Fetch fresh data
+            logger.info("Fetching fresh player rankings")
+            players = await self.fetch_players_list()
             
-        return players
+            # Update cache if fetch was successful
+            if players:
+                self._cache_players(players)
+                
+            return players
 
     async def fetch_players_list(self) -> Dict[str, Dict[str, str]]:
         """Fetch current NBA players list from hashtagbasketball.com
@@ -804,76 +1261,62 @@ class MistralAgent:
         Returns:
             Dict mapping player names to their attributes
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-        
         try:
             players_map = {}
             url = "https://hashtagbasketball.com/fantasy-basketball-rankings"
             
             logger.info("Starting to fetch top 215 players from hashtagbasketball.com")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logger.error(f"Failed to fetch players: {response.status}")
-                        return {}
-                    
-                    logger.info("Successfully got response from server")
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Find the rankings table
-                    rankings_table = soup.find('table', {'id': 'ContentPlaceHolder1_GridView1'})
-                    
-                    if not rankings_table:
-                        logger.warning("Could not find rankings table")
-                        return {}
-                    
-                    # Get headers
-                    header_row = rankings_table.find('tr')
-                    if not header_row:
-                        logger.warning("Could not find table headers")
-                        return {}
-                    
-                    headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
-                    
-                    # Extract player data from table rows
-                    rows = rankings_table.find_all('tr')[1:]  # Skip header row
-                    if not rows:
-                        logger.warning("No player rows found in rankings table")
-                        return {}
-                    
-                    # Extract player data from table rows
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 2:  # Make sure we have enough cells
-                            player_name = cells[1].get_text(strip=True)  # Player name is in second column
-                            if player_name and player_name != "PLAYER":  # Skip entries that are just "PLAYER"
-                                # Create dictionary of all stats for this player
-                                stats = {}
-                                for i, cell in enumerate(cells):
-                                    if i < len(headers):  # Make sure we have a header for this column
-                                        stats[headers[i]] = cell.get_text(strip=True)
-                                players_map[player_name] = stats
-                    
-                    if not players_map:
-                        logger.warning("No players found in rankings")
-                        return {}
-                    
-                    initial_count = len(players_map)
-                    # Filter out any remaining "PLAYER" entries
-                    players_map = {name: stats for name, stats in players_map.items() if name != "PLAYER"}
-                    if len(players_map) != initial_count:
-                        logger.info(f"Removed {initial_count - len(players_map)} invalid player entries")
-                    
-                    logger.info(f"Successfully fetched {len(players_map)} players from hashtagbasketball.com")
-                    return players_map
-                    
+            async with self._fetch(url, headers=RANKINGS_HEADERS) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to fetch players: {response.status}")
+                    return {}
+                
+                logger.info("Successfully got response from server")
+                # Parse in a worker thread so a large page doesn't stall the event loop
+                tree = await asyncio.to_thread(lxml.html.fromstring, await response.read())
+                
+                # Find the rankings table
+                rankings_table = RANKINGS_TABLE_XPATH(tree)
+                
+                if not rankings_table:
+                    logger.warning("Could not find rankings table")
+                    return {}
+                
+                # Get headers
+                all_rows = list(rankings_table[0].iter('tr'))
+                if not all_rows:
+                    logger.warning("Could not find table headers")
+                    return {}
+                
+                headers = [_cell_text(th) for th in all_rows[0].iter('th')]
+                
+                # Extract player data from table rows
+                rows = all_rows[1:]  # Skip header row
+                if not rows:
+                    logger.warning("No player rows found in rankings table")
+                    return {}
+                
+                # Extract player data from table rows
+                header_count = len(headers)
+                for row in rows:
+                    # Read each cell's text once, stopping at the last column that has a header
+                    texts = [_cell_text(cell) for cell in islice(row.iter('td'), header_count)]
+                    player_name = texts[1] if len(texts) > 1 else ''  # Player name is in second column
+                    if not player_name or player_name == "PLAYER":  # Skip entries that are just "PLAYER"
+                        continue
+                    stats = dict(zip(headers, texts))
+                    stats['R#'] = player_rank(stats)  # Parse the rank once here instead of on every comparison
+                    players_map[player_name] = stats
+                
+                if not players_map:
+                    logger.warning("No players found in rankings")
+                    return {}
+                
+                logger.info(f"Successfully fetched {len(players_map)} players from hashtagbasketball.com")
+                # Sort by rank once so every consumer can take the top players in iteration order
+                return dict(sorted(players_map.items(), key=lambda item: item[1]['R#']))
+                
         except Exception as e:
             logger.error(f"Error fetching players from hashtagbasketball.com: {str(e)}")
             return {}
@@ -885,11 +1328,13 @@ class MistralAgent:
             return ">>> A draft is already in progress in this channel! Use `!pick` to record picks."
         
         draft_state = DraftState(total_rounds, pick_position, total_players)
+        # A new draft starts from fresh game logs rather than scrapes left over from earlier requests
+        self.scrape_cache.clear()
         
         try:
             # Fetch initial player list
             players_with_stats = await self._get_players()
-            draft_state.available_players = [player[0] for player in players_with_stats.items()]
+            draft_state.available_players = dict.fromkeys(players_with_stats)
             
             if not draft_state.available_players:
                 return ">>> Error: Could not fetch player list. Please try again later."
@@ -957,17 +1402,19 @@ Your pick will come up every {total_players} picks. Good luck! 🎯"""
                 except KeyError:
                     return f">>> Invalid position '{position}'. Please use: PG, SG, SF, PF, C, or UTIL"
             
-            # Find the best matching player in available players
-            best_match = None
-            for player in draft_state.available_players:
-                if player_name.lower() in player.lower():
-                    if best_match is None or len(player) < len(best_match):
+            # Find the best matching player in available players, exact names first
+            best_match = player_name if player_name in draft_state.available_players else None
+            if best_match is None:
+                search_name = player_name.lower()
+                for player in draft_state.available_players:
+                    player_lower = player.lower()
+                    if search_name in player_lower:
+                        if best_match is None or len(player) < len(best_match):
+                            best_match = player
+                    # Also check first/last name exact matches
+                    if search_name in player_lower.split():
                         best_match = player
-                # Also check first/last name exact matches
-                player_parts = player.lower().split()
-                if player_name.lower() in player_parts:
-                    best_match = player
-                    break
+                        break
             
             # If no match found, use the provided name as is
             if not best_match:
@@ -975,7 +1422,8 @@ Your pick will come up every {total_players} picks. Good luck! 🎯"""
                 best_match = player_name.title()  # Convert to title case for consistency
             else:
                 # Remove the player from available players only if they were in our list
-                draft_state.available_players.remove(best_match)
+                del draft_state.available_players[best_match]
+                draft_state.invalidate_summaries()
             
             # Record the pick and update round
             draft_state.picks_made += 1
@@ -985,7 +1433,7 @@ Your pick will come up every {total_players} picks. Good luck! 🎯"""
             # Add to drafted players and user's team if it's their pick
             draft_state.drafted_players.append((best_match, pos_enum))
             if is_user_pick:
-                draft_state.my_team.append((best_match, pos_enum))
+                draft_state.add_to_my_team(best_match, pos_enum)
             
             # Check if draft is complete
             if draft_state.picks_made >= (draft_state.total_players * draft_state.total_rounds):
@@ -1039,28 +1487,26 @@ Draft Status:
             content = content[4:]
         
         responses = []
-        current_chunk = ""
+        chunk_lines: List[str] = []  # Lines of the chunk being built
+        chunk_len = 0  # Length of the chunk once its lines are joined with newlines
         
         for line in content.split('\n'):
             # If adding this line would exceed Discord's limit, start a new chunk
-            if len(current_chunk) + len(line) + 1 > chunk_size:
-                # Add block quote prefix to chunk if it doesn't have it
-                if not has_block_quote:
-                    responses.append(f">>> {current_chunk}")
-                else:
-                    responses.append(f">>> {current_chunk}")
-                current_chunk = line
+            if chunk_len + len(line) + 1 > chunk_size:
+                responses.append(">>> " + "\n".join(chunk_lines))
+                chunk_lines = [line]
+                chunk_len = len(line)
+            elif chunk_len:
+                chunk_lines.append(line)
+                chunk_len += len(line) + 1
             else:
-                if current_chunk:
-                    current_chunk += '\n'
-                current_chunk += line
+                # Nothing visible in the chunk yet, so no newline goes in front of this line
+                chunk_lines = [line]
+                chunk_len = len(line)
         
         # Add the last chunk if it's not empty
-        if current_chunk:
-            if not has_block_quote:
-                responses.append(f">>> {current_chunk}")
-            else:
-                responses.append(f">>> {current_chunk}")
+        if chunk_len:
+            responses.append(">>> " + "\n".join(chunk_lines))
             
         return responses
 
@@ -1080,18 +1526,11 @@ Draft Status:
             picks_until_turn = (draft_state.total_players - current_pick) + draft_state.pick_position
         
         # Get roster needs
-        needs = draft_state.get_roster_needs()
-        needs_str = "Current roster needs:\n"
-        for pos, count in needs.items():
-            if count > 0:
-                needs_str += f"• {pos.value}: {count} needed\n"
-        
-        # Get current information about available players
-        available_players_str = ", ".join(draft_state.available_players[:10])
+        needs_str = draft_state.needs_summary()
         
-        # Use web search to get current information about top available players
-        search_term = f"{available_players_str} NBA fantasy basketball rankings current stats injuries 2024"
-        web_search_result = await self.web_search(search_term)
+        # Top available players (kept in rank order); the recommendation call itself
+        # covers their current stats and injuries, so no separate lookup call is made
+        available_players_str = draft_state.top_available_summary()
         
         # Draft position context
         picks_context = ""
@@ -1101,35 +1540,27 @@ Draft Status:
             picks_context = f"You pick in {picks_until_turn} picks"
 
         messages = [
-            {"role": "system", "content": f"""You are a fantasy basketball draft expert. Consider:
-1. Current round: {draft_state.current_round}/{draft_state.total_rounds}
-2. Draft position: Pick {draft_state.pick_position} of {draft_state.total_players}
-3. Current pick in round: {current_pick}/{draft_state.total_players}
-4. Picks until your turn: {picks_until_turn}
-5. My team so far: {', '.join([f"{player}" for player, _ in draft_state.my_team])}
-6. Roster needs:
-{needs_str}
-
-Current player information:
-{web_search_result}
-
-Provide draft recommendations in strictly in the following format:
-1. Draft Position Analysis: 2-3 sentences about the current draft state and picks until your turn
-2. Draft Strategy: 2-3 sentences about what to prioritize based on draft position, current pick, and team needs
-3. Top Available Players: List 5 best available players with 1-line explanation for each
-4. Recommendations:
-   - If it's your turn: State best pick and second-best pick with brief reasoning
-   - If not your turn: List 2-3 players you hope will still be available at your pick
-
-Focus on:
-- Draft position strategy (who might be available at your pick)
-- Team needs and roster construction
-- Position scarcity
-- Injury status and availability
-- Recent performance and trends"""},
+            {"role": "system", "content": DRAFT_PROMPT.format_map({
+                "current_round": draft_state.current_round,
+                "total_rounds": draft_state.total_rounds,
+                "pick_position": draft_state.pick_position,
+                "total_players": draft_state.total_players,
+                "current_pick": current_pick,
+                "picks_until_turn": picks_until_turn,
+                "my_team": draft_state.team_summary(),
+                "needs_str": needs_str,
+                "available_players_str": available_players_str,
+            })},
             {"role": "user", "content": f"Analyze the draft situation and recommend players considering {picks_context}. Available players include: {available_players_str}"}
         ]
 
+        # The prompt only changes when a pick is recorded, so repeated !getrec calls reuse the answer;
+        # a digest keeps multi-KB prompts out of the cache keys
+        cache_key = hashlib.sha256(json.dumps(messages, sort_keys=True).encode()).hexdigest()
+        cached_responses = self.recommendation_cache.get(cache_key)
+        if cached_responses is not None:
+            return cached_responses
+
         response = await self.client.chat.complete_async(
             model=MISTRAL_MODEL,
             messages=messages,
@@ -1142,23 +1573,44 @@ Focus on:
 {response.choices[0].message.content}"""
         
         # Add block quote to the beginning of the response
-        return self._split_into_messages(f">>> {full_response}")
+        responses = self._split_into_messages(f">>> {full_response}")
+        self.recommendation_cache.set(cache_key, responses)
+        return responses
+
+    async def _news_search(self, query: str) -> str:
+        """Dated headlines and snippets for a query from the news search RSS feed.
+        
+        Raises:
+            aiohttp.ClientResponseError: If the search returns an error status
+        """
+        params = {"q": query, "format": "rss"}
+        async with self._fetch(NEWS_SEARCH_URL, params=params, headers=NEWS_SEARCH_HEADERS) as response:
+            response.raise_for_status()
+            feed = await response.read()
+        
+        root = etree.fromstring(feed, NEWS_SEARCH_PARSER) if feed else None
+        items = NEWS_SEARCH_ITEMS_XPATH(root) if root is not None else []
+        snippets = []
+        for item in items[:NEWS_SEARCH_MAX_ITEMS]:
+            title = item.findtext('title', '').strip()
+            description = item.findtext('description', '').strip()
+            published = item.findtext('pubDate', '').strip()
+            snippets.append(f"- {published}: {title}. {description}" if published else f"- {title}. {description}")
+        return "\n".join(snippets) or f"No recent news found for: {query}"
 
     async def web_search(self, query: str) -> str:
-        """Perform a web search using the web_search tool."""
+        """Look up current information as recent news snippets."""
+        # Normalize the query so reordered or re-cased searches share a cache entry
+        cache_key = " ".join(sorted(set(query.lower().split())))
+        cached_result = self.search_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
         try:
-            # Use the web_search tool
-            search_result = await self.client.chat.complete_async(
-                model=MISTRAL_MODEL,
-                messages=[{
-                    "role": "system", 
-                    "content": "You are searching for current NBA player information. Return only factual, relevant information."
-                }, {
-                    "role": "user",
-                    "content": query
-                }]
-            )
-            return search_result.choices[0].message.content
+            # Concurrent searches are capped by the news host's slot in _fetch
+            result = await self._news_search(query)
+            self.search_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error in web search for query '{query}': {str(e)}")
             return f">>> Error performing web search: {str(e)}"
@@ -1170,92 +1622,36 @@ Focus on:
             # For draft mode, we only show names since we store only names in draft state
             draft_state = self.draft_states[channel_id]
             all_players = await self._get_players()
+            cached_view = draft_state.cached_view("players", all_players)
+            if cached_view is not None:
+                return cached_view
             players = {name: all_players.get(name, {}) for name in draft_state.available_players}
             prefix = "Available Players in Draft"
+            draft_view = True
         else:
             # Get players from cache or fetch fresh data
             players = await self._get_players()
             prefix = "NBA Players Ranked by Fantasy Value"
+            draft_view = False
+            # The full rankings table only changes when the rankings snapshot does
+            cached_players, cached_table = self._rankings_table
+            if players and cached_players is players:
+                return cached_table
             
         if not players:
             return [">>> Could not fetch player rankings. Please try again later."]
         
-        # Build the full content first
-        content = []
-        
-        # If we have stats for players, create a formatted table
-        first_player_stats = next(iter(players.values()))
-        if first_player_stats:  # If we have stats
-            # Most important columns for fantasy basketball
-            essential_columns = [
-                'R#',        # Rank
-                'PLAYER',    # Player Name
-                'TEAM',      # Team
-                'POS',       # Position
-                'PTS',       # Points
-                'REB',       # Rebounds
-                'AST',       # Assists
-                'STL',       # Steals
-                'BLK',       # Blocks
-                'TO',        # Turnovers
-                'FG%',       # Field Goal %
-                '3PM',       # Three Pointers Made
-                'FT%'        # Free Throw %
-            ]
-            
-            # Filter columns that exist in our data
-            filtered_columns = [col for col in essential_columns if col in first_player_stats]
-            
-            # Define column widths
-            col_widths = {
-                'rank': 4,   # Width for rank number (increased to accommodate the period)
-                'name': max(max(len(name) for name in players.keys()), len("PLAYER")) + 1,  # Width for player names
-            }
-            
-            # Calculate width for each stat column
-            for col in filtered_columns:
-                if col not in ['R#', 'PLAYER']:  # Skip rank and player name as they're handled separately
-                    col_widths[col] = max(
-                        max(len(str(stats.get(col, ''))) for stats in players.values()),  # Max width of values
-                        len(col)  # Width of header
-                    ) + 1  # Add minimal padding
-            
-            # Create header line
-            header_line = f"{'#':>{col_widths['rank']}} {'PLAYER':<{col_widths['name']}}"
-            for col in filtered_columns:
-                if col not in ['R#', 'PLAYER']:
-                    header_line += f" {col:^{col_widths[col]}}"
-            
-            # Create separator line
-            separator = "-" * len(header_line)
-            
-            # Add header to content
-            content.append(f"{prefix} (top {len(players)}):\n")
-            content.append(header_line)
-            content.append(separator)
-            
-            # Add player rows
-            sorted_players = sorted(players.items(), key=lambda x: int(x[1].get('R#', '999')))
-            for i, (player_name, stats) in enumerate(sorted_players, 1):
-                player_line = f"{i:>2}. {player_name:<{col_widths['name']}}"  # Added period after rank
-                for col in filtered_columns:
-                    if col not in ['R#', 'PLAYER']:
-                        value = stats.get(col, '')
-                        # Right-align numeric columns, center-align others
-                        if col in ['PTS', 'REB', 'AST', 'STL', 'BLK', 'TO', '3PM']:
-                            player_line += f" {value:>{col_widths[col]}}"
-                        else:
-                            player_line += f" {value:^{col_widths[col]}}"
-                content.append(player_line)
-        else:
-            # Simple numbered list for draft mode
-            content.append(f"{prefix} (top {len(players)}):\n")
-            for i, player_name in enumerate(players.keys(), 1):
-                content.append(f"{i:>3}. {player_name}")
+        # Formatting a few hundred rows is CPU work; keep it off the event loop
+        content = await asyncio.to_thread(render_players_table, players, prefix)
         
         # Join all content with newlines and split into messages
         # Add block quote at the beginning
-        return self._split_into_messages(">>> {}".format("\n".join(content)))
+        responses = self._split_into_messages(">>> {}".format("\n".join(content)))
+        if draft_view:
+            draft_state.store_view("players", all_players, responses)
+        else:
+            self._rankings_table = (players, responses)
+        return responses
 
     async def show_my_team(self, channel_id: int) -> List[str]:
         """Show the user's current team in the draft"""
@@ -1271,36 +1667,25 @@ Focus on:
             
         # Get the latest player stats
         all_players = await self._get_players()
+        cached_view = draft_state.cached_view("myteam", all_players)
+        if cached_view is not None:
+            return cached_view
         
         content = []
         content.append("🏀 Your Current Team 🏀\n")
         
-        # Group players by position
-        players_by_position = defaultdict(list)
+        # Group players by position in one pass; unassigned picks go last under FLEX
+        players_by_position = {position: [] for position in Position}
+        players_by_position["FLEX"] = []
         for player, position in draft_state.my_team:
-            players_by_position[position if position else "FLEX"].append(player)
+            players_by_position[position or "FLEX"].append(player)
             
-        # Display team composition
-        for position in Position:
-            players = players_by_position.get(position, [])
-            if players:
-                content.append(f"{position.value}:")
-                for player in players:
-                    # Use _find_player_match to get the correct player stats
-                    match = self._find_player_match(player, all_players)
-                    if match:
-                        player_name, stats = match
-                        # Use uppercase keys consistently
-                        content.append(f"  • {player_name} - {stats.get('TEAM', 'N/A')} ({stats.get('POS', 'N/A')})")
-                    else:
-                        content.append(f"  • {player}")
-                content.append("")
-        
-        # Show flex/unassigned players
-        flex_players = players_by_position.get("FLEX", [])
-        if flex_players:
-            content.append("Unassigned Players:")
-            for player in flex_players:
+        # Display team composition, skipping empty positions
+        for position, players in players_by_position.items():
+            if not players:
+                continue
+            content.append("Unassigned Players:" if position == "FLEX" else f"{position.value}:")
+            for player in players:
                 # Use _find_player_match to get the correct player stats
                 match = self._find_player_match(player, all_players)
                 if match:
@@ -1318,18 +1703,25 @@ Focus on:
         content.append(f"• Total Players Drafted: {len(draft_state.my_team)}")
         
         # Add block quote at the beginning
-        return self._split_into_messages(">>> {}".format("\n".join(content)))
+        responses = self._split_into_messages(">>> {}".format("\n".join(content)))
+        draft_state.store_view("myteam", all_players, responses)
+        return responses
 
     async def _scrape_real_time_news(self, player_name: str) -> Optional[dict]:
+        """Get real-time news for a player, reusing a recent scrape when available."""
+        cache_key = normalize_name(player_name)
+        cached_news = self.scrape_cache.get(cache_key)
+        if cached_news is not None:
+            return cached_news
+        
+        news = await self._fetch_real_time_news(player_name)
+        # Failed scrapes aren't cached so the next request retries
+        if news is not None:
+            self.scrape_cache.set(cache_key, news)
+        return news
+
+    async def _fetch_real_time_news(self, player_name: str) -> Optional[dict]:
         """Get real-time news using NBA stats API and Basketball Reference."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Origin': 'https://www.nba.com',
-            'Referer': 'https://www.nba.com/'
-        }
-        
         try:
             # Format player name for Basketball Reference URL
             # Example: "Nikola Jokic" -> "jokicni01"
@@ -1339,59 +1731,46 @@ Focus on:
             
             # URLs for different data sources
             bref_url = f"https://www.basketball-reference.com/players/{last_name[0]}/{bref_id}.html"
+            schedule_url = "https://www.basketball-reference.com/leagues/NBA_2025_games.html"
             
-            async with aiohttp.ClientSession() as session:
-                # Get latest game data from Basketball Reference
-                async with session.get(bref_url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Get most recent game
-                        game_log = soup.find('div', id='div_pgl_basic')
-                        if game_log:
-                            latest_game = game_log.find('tr')  # First row is most recent
-                            if latest_game:
-                                date = latest_game.find('td', {'data-stat': 'date_game'})
-                                pts = latest_game.find('td', {'data-stat': 'pts'})
-                                reb = latest_game.find('td', {'data-stat': 'trb'})
-                                ast = latest_game.find('td', {'data-stat': 'ast'})
-                                opp = latest_game.find('td', {'data-stat': 'opp_id'})
-                                
-                                if all([date, pts, reb, ast, opp]):
-                                    return {
-                                        'source': 'Basketball Reference',
-                                        'date': date.text,
-                                        'type': 'Game Performance',
-                                        'headline': f"{player_name} vs {opp.text}",
-                                        'description': f"Latest Game Stats: {pts.text} PTS, {reb.text} REB, {ast.text} AST"
-                                    }
-                
-                # If we can't get the latest game, try to get their next game
-                schedule_url = "https://www.basketball-reference.com/leagues/NBA_2025_games.html"
-                async with session.get(schedule_url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Find next game involving the player's team
-                        schedule = soup.find('div', id='div_schedule')
-                        if schedule:
-                            upcoming_games = schedule.find_all('tr')
-                            for game in upcoming_games:
-                                if last_name.lower() in game.text.lower():
-                                    date = game.find('th', {'data-stat': 'date_game'})
-                                    visitor = game.find('td', {'data-stat': 'visitor_team_name'})
-                                    home = game.find('td', {'data-stat': 'home_team_name'})
-                                    if all([date, visitor, home]):
-                                        return {
-                                            'source': 'Basketball Reference',
-                                            'date': date.text,
-                                            'type': 'Upcoming Game',
-                                            'headline': f"{player_name}'s Next Game",
-                                            'description': f"{visitor.text} @ {home.text}"
-                                        }
+            # Request the player page and the schedule concurrently; the schedule
+            # is only parsed if the latest game can't be read from the player page
+            player_html, schedule_html = await asyncio.gather(
+                self._fetch_page(bref_url, b'id="div_pgl_basic"', BREF_GAME_LOG_TAIL_BYTES, headers=NEWS_SCRAPE_HEADERS),
+                self._fetch_page(schedule_url, headers=NEWS_SCRAPE_HEADERS)
+            )
+            
+            # Get latest game data from Basketball Reference
+            if player_html:
+                # Get most recent game; first row is most recent
+                latest_game = BREF_LATEST_GAME_XPATH(await asyncio.to_thread(lxml.html.fromstring, player_html))
+                if latest_game:
+                    cells = data_stat_cells(latest_game[0])
+                    if all(stat in cells for stat in ('date_game', 'pts', 'trb', 'ast', 'opp_id')):
+                        return {
+                            'source': 'Basketball Reference',
+                            'date': cells['date_game'],
+                            'type': 'Game Performance',
+                            'headline': f"{player_name} vs {cells['opp_id']}",
+                            'description': f"Latest Game Stats: {cells['pts']} PTS, {cells['trb']} REB, {cells['ast']} AST"
+                        }
             
+            # If we can't get the latest game, try to get their next game
+            if schedule_html:
+                # Find next game involving the player's team; only candidate rows are parsed
+                for row in schedule_rows_mentioning(schedule_html, last_name.encode()):
+                    game = lxml.html.fromstring(b'<table>' + row + b'</table>').find('.//tr')
+                    if game is not None and last_name in game.text_content().lower():
+                        cells = data_stat_cells(game)
+                        if all(stat in cells for stat in ('date_game', 'visitor_team_name', 'home_team_name')):
+                            return {
+                                'source': 'Basketball Reference',
+                                'date': cells['date_game'],
+                                'type': 'Upcoming Game',
+                                'headline': f"{player_name}'s Next Game",
+                                'description': f"{cells['visitor_team_name']} @ {cells['home_team_name']}"
+                            }
+        
             return None
             
         except Exception as e:
@@ -1400,98 +1779,177 @@ Focus on:
 
     async def _get_espn_player_id(self, player_name: str) -> Optional[str]:
         """Find ESPN player ID by searching their site."""
+        # IDs never change, so a found ID is cached for the life of the process
+        cache_key = player_name.lower().strip()
+        cached_id = self.espn_id_cache.get(cache_key)
+        if cached_id is not None:
+            return cached_id
+        
         try:
             search_url = f"https://www.espn.com/nba/players/_/search/{player_name.replace(' ', '+')}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Find player link which contains the ID
-                        player_link = soup.find('a', href=lambda x: x and '/nba/player/_/id/' in x)
-                        if player_link:
-                            player_id = player_link['href'].split('/id/')[1].split('/')[0]
-                            return player_id
+            async with self._fetch(search_url) as response:
+                if response.status == 200:
+                    # Find the first player link in the raw bytes; no need to build a tree for one ID
+                    match = ESPN_PLAYER_LINK_RE.search(await response.read())
+                    if match:
+                        player_id = match.group(1).decode()
+                        self.espn_id_cache.set(cache_key, player_id)
+                        return player_id
             return None
         except Exception as e:
             logger.error(f"Error finding ESPN ID for {player_name}: {str(e)}")
             return None
 
-    async def get_player_news(self, player_name: str) -> List[str]:
-        """Get the latest news about an NBA player from ESPN."""
-        try:
-            # First try to find the exact player name from our rankings
+    def _lookup_espn_id(self, player_name: str) -> Optional[Tuple[str, str]]:
+        """Find (name, ESPN ID) for a player by exact name, then by a name containing every query token, then by substring."""
+        normalized = player_name.lower().strip()
+        exact = ESPN_ID_BY_NORM.get(normalized)
+        if exact:
+            return exact
+        
+        # A suffix alone ("Jr.") names no one; leave it to the ESPN search
+        tokens = [token for token in dict.fromkeys(normalized.split()) if token not in NAME_SUFFIXES]
+        if not tokens:
+            return None
+        
+        # Only a candidate sharing every query token counts, so "Marcus Morris" can't land on
+        # Marcus Smart; ties keep the first candidate seen
+        overlap: Dict[Tuple[str, str], int] = {}
+        for token in tokens:
+            for candidate in ESPN_ID_BY_TOKEN.get(token, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+        for candidate, shared in overlap.items():
+            if shared == len(tokens):
+                return candidate
+        
+        # Last resort: partial names like "gilgeous" against the pre-lowercased keys
+        if normalized:
+            for known_name, match in ESPN_ID_BY_NORM.items():
+                if normalized in known_name or known_name in normalized:
+                    return match
+        return None
+
+    async def _get_espn_player_bundle(self, player_name: str) -> Optional[EspnPlayerBundle]:
+        """Resolve a player's ESPN ID and fetch and parse their ESPN page in one pass.
+        
+        Returns:
+            The parsed page data, or None if the player can't be found on ESPN
+        
+        Raises:
+            aiohttp.ClientResponseError: If ESPN returns an error status
+        """
+        # Known names resolve straight from the local ID map without touching the rankings
+        stats = None
+        espn_match = ESPN_ID_BY_NORM.get(player_name.lower().strip())
+        if not espn_match:
+            # Otherwise try to find the exact player name from our rankings
             players = await self._get_players()
             match = self._find_player_match(player_name, players)
             if match:
-                player_name = match[0]  # Use the exact name from rankings
-                player_stats = match[1]  # Get player stats
+                player_name, stats = match  # Use the exact name and stats from rankings
             
             # Look up player ID in our mapping
-            player_id = None
-            for known_name, espn_id in self.ESPN_PLAYER_IDS.items():
-                if player_name.lower() in known_name.lower() or known_name.lower() in player_name.lower():
-                    player_id = espn_id
-                    player_name = known_name  # Use the exact name from our mapping
-                    break
-            
+            espn_match = self._lookup_espn_id(player_name)
+        
+        if espn_match:
+            player_name, player_id = espn_match  # Use the exact name from our mapping
+        else:
+            # Fall back to ESPN's own player search
+            player_id = await self._get_espn_player_id(player_name)
             if not player_id:
+                return None
+        
+        # Scrape ESPN player page
+        url = f"https://www.espn.com/nba/player/_/id/{player_id}"
+        
+        async with self._fetch(url) as response:
+            response.raise_for_status()
+            # The header and fantasy news come early; stop reading shortly after the news block
+            body = await read_until(response, b'FantasyOverview__News', ESPN_NEWS_TAIL_BYTES)
+        
+        # Parse in a worker thread so the event loop keeps serving other commands meanwhile
+        tree = await asyncio.to_thread(lxml.html.fromstring, body)
+        
+        # Get player info
+        team_info = ESPN_TEAM_XPATH(tree)
+        bundle = EspnPlayerBundle(
+            player_name=player_name,
+            player_id=player_id,
+            team=team_info[0].text_content() if team_info else "N/A",
+            stats=stats
+        )
+        
+        # Find the Fantasy Overview section and read its News and Spin sections
+        fantasy_news = ESPN_NEWS_XPATH(tree)
+        if fantasy_news:
+            news_time = ESPN_NEWS_TIME_XPATH(fantasy_news[0])
+            news_content = ESPN_NEWS_CONTENT_XPATH(fantasy_news[0])
+            spin_content = ESPN_SPIN_XPATH(fantasy_news[0])
+            bundle.news_time = news_time[0].text_content() if news_time else None
+            bundle.news_content = news_content[0].text_content().strip() if news_content else None
+            bundle.analysis = spin_content[0].text_content().strip() if spin_content else None
+        
+        return bundle
+
+    async def get_player_news(self, player_name: str, refresh: bool = False) -> List[str]:
+        """Get the latest news about an NBA player from ESPN.
+        
+        Args:
+            player_name: Player to look up
+            refresh: Fetch from ESPN even if a cached result is still fresh, as the warm-up does
+        """
+        # Serve recent lookups from memory; ESPN fantasy news updates at most hourly
+        cache_key = player_name.lower().strip()
+        cached_news = None if refresh else self.news_cache.get(cache_key)
+        if cached_news is not None:
+            return cached_news
+        
+        try:
+            bundle = await self._get_espn_player_bundle(player_name)
+            if bundle is None:
                 return [">>> ❌ Player Not Found: Could not find player in database. Please check the spelling and try again."]
             
-            # Scrape ESPN player page
-            url = f"https://www.espn.com/nba/player/_/id/{player_id}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            if bundle.news_content or bundle.analysis:
+                result = [self._format_news_message(
+                    player_name=bundle.player_name,
+                    team=bundle.team,
+                    news_time=bundle.news_time,
+                    news_content=bundle.news_content,
+                    analysis=bundle.analysis,
+                    stats=bundle.stats
+                )]
+            else:
+                result = [self._format_no_news_message(bundle.player_name, bundle.team, bundle.stats)]
+            
+            self.news_cache.set(cache_key, result)
+            return result
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        return [f">>> ❌ Error: Could not access ESPN data for {player_name}"]
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Get player info
-                    player_info = soup.find('div', class_='PlayerHeader__Main_Aside')
-                    team_info = player_info.find('a', class_='AnchorLink') if player_info else None
-                    current_team = team_info.text if team_info else "N/A"
-                    
-                    # Find the Fantasy Overview section
-                    fantasy_news = soup.find('div', class_='FantasyOverview__News')
-                    if not fantasy_news:
-                        return [self._format_no_news_message(player_name, current_team, player_stats if match else None)]
-                    
-                    # Get the News section
-                    news_p = fantasy_news.find('p', class_='nws')
-                    news_time = news_p.find('span', class_='FantasyNews__relDate') if news_p else None
-                    news_content = news_p.find('span', class_='FantasyNews__content') if news_p else None
-                    
-                    # Get the Spin section
-                    spin_p = fantasy_news.find('p', class_='spn')
-                    spin_content = spin_p.find('span') if spin_p else None
-                    
-                    if news_content or spin_content:
-                        return [self._format_news_message(
-                            player_name=player_name,
-                            team=current_team,
-                            news_time=news_time.text if news_time else None,
-                            news_content=news_content.text.strip() if news_content else None,
-                            analysis=spin_content.text.strip() if spin_content else None,
-                            stats=player_stats if match else None
-                        )]
-                    
-                    return [self._format_no_news_message(player_name, current_team, player_stats if match else None)]
-                
+        except aiohttp.ClientResponseError:
+            return [f">>> ❌ Error: Could not access ESPN data for {player_name}"]
         except Exception as e:
             logger.error(f"Error getting news for {player_name}: {str(e)}")
             return [f">>> ❌ Error: Could not retrieve news for {player_name}. Please try again later."]
 
+    async def get_player_news_batch(self, player_names: List[str], refresh: bool = False) -> Dict[str, List[str]]:
+        """Get the latest news for several players concurrently.
+        
+        ESPN page fetches share the agent's connection pool and per-host
+        concurrency cap with single lookups, so large batches don't flood ESPN.
+        
+        Returns:
+            Dict mapping each requested name to its news messages
+        """
+        results = await asyncio.gather(*[self.get_player_news(name, refresh) for name in player_names], return_exceptions=True)
+        
+        news = {}
+        for name, result in zip(player_names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting news for {name}: {str(result)}")
+                result = [f">>> ❌ Error: Could not retrieve news for {name}. Please try again later."]
+            news[name] = result
+        return news
+
     def _format_news_message(self, player_name: str, team: str, news_time: Optional[str] = None,
                            news_content: Optional[str] = None, analysis: Optional[str] = None,
                            stats: Optional[Dict[str, str]] = None) -> str:
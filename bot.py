@@ -1,80 +1,197 @@
 import os
+import asyncio
 import discord
+import aiohttp
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from discord.ext import commands
 from agent import MistralAgent
+from help_texts import HELP_TABLE
 from dotenv import load_dotenv
 PREFIX = "!"
+VALID_POSITIONS = frozenset({"PG", "SG", "SF", "PF", "C", "UTIL"})  # Positions accepted for the user's own picks
+THREAD_POOL_WORKERS = 16  # Worker threads for HTML parsing and table rendering
+DISCORD_KEEPALIVE_TIMEOUT = 75  # Seconds idle Discord API connections stay open for reuse
+DISCORD_DNS_CACHE_TTL = 600  # Seconds to cache Discord API DNS lookups
+EMBED_DESCRIPTION_LIMIT = 4096  # Discord's maximum characters in one embed description
+MESSAGE_EMBED_CHARS = 6000  # Discord's maximum characters across all embeds in one message
+MESSAGE_EMBEDS = 10  # Discord's maximum embeds in one message
+LLM_MAX_CONCURRENCY = 8  # Maximum model-backed commands (compare, getrec) running at once
 
 # Setup logging
 logger = logging.getLogger("discord")
 
+# Replies reused across commands
+NO_ACTIVE_DRAFT_MESSAGE = ">>> No active draft in this channel! Start a draft first using the `!draft` command."
+INVALID_DRAFT_PARAMS_MESSAGE = (">>> Invalid draft parameters! Please ensure:\n"
+                                "- Rounds is at least 1\n"
+                                "- Pick position is between 1 and total picks\n"
+                                "- Total picks is at least 2")
+NEED_TWO_PLAYERS_MESSAGE = ">>> Please provide at least 2 players to compare. Usage: `!compare player1 player2 [player3 ...]`"
+
+# The command overview never changes, so it is built once and resent on every !help
+HELP_EMBED = discord.Embed(
+    title="🏀 Fantasy Basketball Assistant Commands",
+    description="Here are all available commands:",
+    color=discord.Color.blue()
+)
+HELP_EMBED.add_field(
+    name="📊 Draft Commands",
+    value="```!draft - Start a new draft session\n!enddraft - End current draft session\n!pick - Record a draft pick\n!getrec - Get draft recommendations\n!myteam - View your team\n!players - Show available players```",
+    inline=False
+)
+HELP_EMBED.add_field(
+    name="🔍 Player Analysis",
+    value="```!compare - Compare multiple players\n!news - Get latest player updates```",
+    inline=False
+)
+HELP_EMBED.add_field(
+    name="ℹ️ Help",
+    value="Type `!help <command>` for detailed information about a specific command",
+    inline=False
+)
+
+# Per-command help embeds, built on first request; the help command itself is copied per invocation
+_command_help_embeds: dict = {}
+
+
 class CustomHelpCommand(commands.HelpCommand):
     """Custom help command implementation"""
     
     async def send_bot_help(self, mapping):
         """Override the main help command"""
-        embed = discord.Embed(
-            title="🏀 Fantasy Basketball Assistant Commands",
-            description="Here are all available commands:",
-            color=discord.Color.blue()
-        )
-        
-        # Add command fields to embed
-        embed.add_field(
-            name="📊 Draft Commands",
-            value="```!draft - Start a new draft session\n!enddraft - End current draft session\n!pick - Record a draft pick\n!getrec - Get draft recommendations\n!myteam - View your team\n!players - Show available players```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔍 Player Analysis",
-            value="```!compare - Compare multiple players\n!news - Get latest player updates```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="ℹ️ Help",
-            value="Type `!help <command>` for detailed information about a specific command",
-            inline=False
-        )
-        
-        # Send the embed to the channel
-        await self.get_destination().send(embed=embed)
+        await self.get_destination().send(embed=HELP_EMBED)
     
     async def send_command_help(self, command):
         """Keep the detailed help for individual commands"""
-        embed = discord.Embed(
-            title=f"!{command.name}",
-            description=command.help or "No description available.",
-            color=discord.Color.blue()
-        )
-        
-        # Add usage field if command has usage info
-        if command.usage:
-            embed.add_field(name="Usage", value=f"```{command.usage}```", inline=False)
+        embed = _command_help_embeds.get(command.qualified_name)
+        if embed is None:
+            embed = discord.Embed(
+                title=f"!{command.name}",
+                description=command.help or "No description available.",
+                color=discord.Color.blue()
+            )
+            
+            # Add usage field if command has usage info
+            if command.usage:
+                embed.add_field(name="Usage", value=f"```{command.usage}```", inline=False)
+            _command_help_embeds[command.qualified_name] = embed
             
         await self.get_destination().send(embed=embed)
 
+class FantasyBot(commands.AutoShardedBot):
+    """Sharded bot that releases the agent's network resources on shutdown"""
+    
+    async def login(self, token: str):
+        """Give discord.py's REST session a connector that keeps sockets and DNS lookups warm"""
+        # limit=0 matches discord.py's default; its own rate limiter already paces requests
+        self.http.connector = aiohttp.TCPConnector(
+            limit=0,
+            keepalive_timeout=DISCORD_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DISCORD_DNS_CACHE_TTL
+        )
+        await super().login(token)
+    
+    async def setup_hook(self):
+        """Size the default thread pool used for parsing and rendering off the event loop"""
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS))
+    
+    async def close(self):
+        """Close the agent's shared HTTP session before disconnecting"""
+        await agent.aclose()
+        await super().close()
+
 # Load the environment variables
 load_dotenv()
 
-# Create the bot with all intents and custom help command
-intents = discord.Intents.all()
-bot = commands.Bot(
+# Create the bot with only the intents command handling needs and custom help command;
+# presence, typing and member events are left off so the gateway never sends them
+intents = discord.Intents.none()
+intents.guilds = True
+intents.guild_messages = True
+intents.dm_messages = True
+intents.message_content = True
+
+# SHARD_COUNT and SHARD_IDS (comma-separated) let several processes split the shards;
+# left unset, one process runs Discord's recommended number of shards
+shard_count = os.getenv("SHARD_COUNT")
+shard_ids = os.getenv("SHARD_IDS")
+bot = FantasyBot(
     command_prefix=PREFIX,
     intents=intents,
-    help_command=CustomHelpCommand()
+    help_command=CustomHelpCommand(),
+    shard_count=int(shard_count) if shard_count else None,
+    shard_ids=[int(shard_id) for shard_id in shard_ids.split(",")] if shard_ids else None
 )
 
 # Import the Mistral agent from the agent.py file
-agent = MistralAgent()
+agent = MistralAgent.instance()
 
 
 # Get the token from the environment variables
 token = os.getenv("DISCORD_TOKEN")
 
+_self_id = 0  # The bot's own user id, cached once connected
+# Commands already run in their own tasks; this bounds how many hold Mistral calls at once
+_llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+
+def _active_draft(channel_id: int):
+    """Return the channel's DraftState if a draft is in progress there, otherwise None"""
+    draft_state = agent.draft_states.get(channel_id)
+    return draft_state if draft_state and draft_state.is_active else None
+
+
+async def _send_responses(ctx, responses: list):
+    """Send each chunk of a multi-message reply in order.
+    
+    Sends stay sequential: concurrent sends can arrive out of order, which splits tables
+    mid-row, and Discord's per-channel rate limit would queue them anyway.
+    """
+    for response in responses:
+        await ctx.send(response)
+
+
+def _embed_descriptions(text: str) -> list:
+    """Split text into embed descriptions within Discord's limit, at line breaks where possible"""
+    descriptions = []
+    current = ""
+    for line in text.split("\n"):
+        # A single line longer than the limit is cut into limit-sized slices
+        while len(line) > EMBED_DESCRIPTION_LIMIT:
+            if current:
+                descriptions.append(current)
+                current = ""
+            descriptions.append(line[:EMBED_DESCRIPTION_LIMIT])
+            line = line[EMBED_DESCRIPTION_LIMIT:]
+        if not current:
+            current = line
+        elif len(current) + 1 + len(line) <= EMBED_DESCRIPTION_LIMIT:
+            current += "\n" + line
+        else:
+            descriptions.append(current)
+            current = line
+    if current:
+        descriptions.append(current)
+    return descriptions
+
+
+async def _send_embeds(ctx, responses: list):
+    """Send a multi-chunk reply as embeds, packing as many into each message as Discord's size limits allow"""
+    batch = []
+    batch_chars = 0
+    for response in responses:
+        for description in _embed_descriptions(response.removeprefix(">>> ")):
+            if batch and (batch_chars + len(description) > MESSAGE_EMBED_CHARS or len(batch) == MESSAGE_EMBEDS):
+                await ctx.send(embeds=batch)
+                batch = []
+                batch_chars = 0
+            batch.append(discord.Embed(description=description, color=discord.Color.blue()))
+            batch_chars += len(description)
+    if batch:
+        await ctx.send(embeds=batch)
+
 
 @bot.event
 async def on_ready():
@@ -84,7 +201,11 @@ async def on_ready():
 
     https://discordpy.readthedocs.io/en/latest/api.html#discord.on_ready
     """
-    logger.info(f"{bot.user} has connected to Discord!")
+    global _self_id
+    _self_id = bot.user.id
+    logger.info("%s has connected to Discord!", bot.user)
+    # Start the agent's background cache warm-up
+    await agent.start()
 
 
 @bot.event
@@ -93,58 +214,54 @@ async def on_message(message: discord.Message):
     Called when a message is sent in any channel the bot can see.
     Only processes command messages starting with the prefix.
     """
+    # Ignore all other messages without handing them to the command parser
+    content = message.content
+    if not content or content[0] != PREFIX or message.author.id == _self_id:
+        return
+
     # Don't delete this line! It's necessary for the bot to process commands.
     await bot.process_commands(message)
 
-    # Ignore all other messages
-    return
-
 
 # Commands
 @bot.command(
     name="compare",
-    help="🔄 Compare NBA players for fantasy value\n\n"
-         "Description:\n"
-         "• Compare multiple players' stats and value\n"
-         "• Analyze current injuries and performance\n"
-         "• Get detailed rankings and comparisons\n\n"
-         "Usage: `!compare player1 player2 [player3 ...]`\n"
-         "Example: `!compare \"LeBron James\" \"Stephen Curry\"`"
+    help=HELP_TABLE["compare"]
 )
 async def compare(ctx, *players):
     """Compare NBA players for fantasy basketball purposes."""
     # Check if we have at least 2 players to compare
     if len(players) < 2:
-        await ctx.send(">>> Please provide at least 2 players to compare. Usage: `!compare player1 player2 [player3 ...]`")
+        await ctx.send(NEED_TWO_PLAYERS_MESSAGE)
         return
         
-    logger.info(f"Comparing players: {', '.join(players)}")
-    await ctx.send(">>> ⌛ Please wait 20 seconds-2 minutes while I analyze these players thoroughly...")
-    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Comparing players: %s", ", ".join(players))
+    progress = await ctx.send(">>> ⌛ Please wait 20 seconds-2 minutes while I analyze these players thoroughly...")
+
+    async def show_progress(partial: str):
+        """Preview the analysis in the progress message as it streams in"""
+        try:
+            await progress.edit(content=f">>> ⌛ {partial[-1900:]}")
+        except discord.HTTPException as e:
+            logger.warning("Could not update comparison preview: %s", e)
+
     # Get responses as a list of messages
-    responses = await agent.compare_players(list(players))
-    # Send each response chunk separately
-    for response in responses:
-        await ctx.send(response)
+    async with _llm_semaphore:
+        responses = await agent.compare_players(list(players), on_update=show_progress)
+    # Replace the preview with the first chunk, then send the rest separately
+    await progress.edit(content=responses[0])
+    await _send_responses(ctx, responses[1:])
 
 
 @bot.command(
     name="draft",
-    help="🎮 Start a fantasy basketball draft\n\n"
-         "Description:\n"
-         "• Initialize new draft session\n"
-         "• Set custom rounds and team count\n"
-         "• Configure your draft position\n\n"
-         "Usage: `!draft rounds pick_position total_picks`\n"
-         "Example: `!draft 13 1 12`"
+    help=HELP_TABLE["draft"]
 )
 async def draft(ctx, rounds: int, pick_position: int, total_picks: int):
     """Start a fantasy basketball draft session."""
     if rounds < 1 or pick_position < 1 or total_picks < 2 or pick_position > total_picks:
-        await ctx.send(">>> Invalid draft parameters! Please ensure:\n"
-                      "- Rounds is at least 1\n"
-                      "- Pick position is between 1 and total picks\n"
-                      "- Total picks is at least 2")
+        await ctx.send(INVALID_DRAFT_PARAMS_MESSAGE)
         return
 
     response = await agent.start_draft(ctx.channel.id, rounds, pick_position, total_picks)
@@ -153,22 +270,16 @@ async def draft(ctx, rounds: int, pick_position: int, total_picks: int):
 
 @bot.command(
     name="pick",
-    help="✏️ Record a draft pick\n\n"
-         "Description:\n"
-         "• Record player selections\n"
-         "• Assign positions to your picks\n"
-         "• Track draft progress\n\n"
-         "Usage: `!pick number \"player_name\" [position]`\n"
-         "Example: `!pick 1 \"LeBron James\" SF`"
+    help=HELP_TABLE["pick"]
 )
 async def pick(ctx, pick_num: int, player_name: str, *args):
     """Record a draft pick."""
     # Check if draft exists and is active
-    if not hasattr(agent, 'draft_states') or ctx.channel.id not in agent.draft_states or not agent.draft_states[ctx.channel.id].is_active:
-        await ctx.send(">>> No active draft in this channel! Start a draft first using the `!draft` command.")
+    draft_state = _active_draft(ctx.channel.id)
+    if draft_state is None:
+        await ctx.send(NO_ACTIVE_DRAFT_MESSAGE)
         return
         
-    draft_state = agent.draft_states[ctx.channel.id]
     current_pick = (draft_state.picks_made % draft_state.total_players) + 1
     
     # Combine all remaining args into player name and position
@@ -177,7 +288,7 @@ async def pick(ctx, pick_num: int, player_name: str, *args):
         # If it's the user's pick, the last argument must be position
         if current_pick == draft_state.pick_position:
             position = args[-1].upper()
-            if position not in ["PG", "SG", "SF", "PF", "C", "UTIL"]:
+            if position not in VALID_POSITIONS:
                 await ctx.send(">>> Invalid position! Please use: PG, SG, SF, PF, C, or UTIL")
                 return
         player_name_parts = args[:-1]  # All but last argument is player name
@@ -193,93 +304,85 @@ async def pick(ctx, pick_num: int, player_name: str, *args):
 
 @bot.command(
     name="getrec",
-    help="💡 Get draft recommendations\n\n"
-         "Description:\n"
-         "• Get best available players\n"
-         "• Receive strategic advice\n"
-         "• Analyze team needs\n\n"
-         "Usage: `!getrec`"
+    help=HELP_TABLE["getrec"]
 )
 async def getrec(ctx):
     """Get draft recommendations considering draft position and current state."""
     # Check if draft exists and is active
-    if not hasattr(agent, 'draft_states') or ctx.channel.id not in agent.draft_states or not agent.draft_states[ctx.channel.id].is_active:
-        await ctx.send(">>> No active draft in this channel! Start a draft first using the `!draft` command.")
+    if _active_draft(ctx.channel.id) is None:
+        await ctx.send(NO_ACTIVE_DRAFT_MESSAGE)
         return
         
-    responses = await agent.get_draft_recommendation(ctx.channel.id)
-    for response in responses:
-        await ctx.send(response)
+    async with _llm_semaphore:
+        responses = await agent.get_draft_recommendation(ctx.channel.id)
+    await _send_embeds(ctx, responses)
 
 
 @bot.command(
     name="players",
-    help="📊 Show available players\n\n"
-         "Description:\n"
-         "• View all available players\n"
-         "• See fantasy rankings\n"
-         "• Check player statistics\n\n"
-         "Usage: `!players`"
+    help=HELP_TABLE["players"]
 )
 async def players(ctx):
     """Show the list of available NBA players."""
     responses = await agent.show_players(ctx.channel.id)
-    for response in responses:
-        await ctx.send(response)
+    # Plain messages keep the wide fixed-width table from wrapping inside embeds
+    await _send_responses(ctx, responses)
 
 
 @bot.command(
     name="myteam",
-    help="👥 View your current team\n\n"
-         "Description:\n"
-         "• See your drafted players\n"
-         "• Check team composition\n"
-         "• View roster by position\n\n"
-         "Usage: `!myteam`"
+    help=HELP_TABLE["myteam"]
 )
 async def myteam(ctx):
     """Show your current team in the draft."""
     responses = await agent.show_my_team(ctx.channel.id)
-    for response in responses:
-        await ctx.send(response)
+    await _send_embeds(ctx, responses)
 
 
 @bot.command(
     name="news",
-    help="📰 Get player news and updates\n\n"
-         "Description:\n"
-         "• Check injury status\n"
-         "• See recent performance\n"
-         "• Get latest updates\n\n"
-         "Usage: `!news \"player_name\"`\n"
-         "Example: `!news \"LeBron James\"`"
+    help=HELP_TABLE["news"]
 )
 async def news(ctx, player_name: str, *, rest: str = ""):
     """Get recent news and updates about an NBA player."""
     # Combine player name if it was split across arguments
     full_player_name = f"{player_name} {rest}".strip()
     
-    logger.info(f"Fetching news for player: {full_player_name}")
+    logger.info("Fetching news for player: %s", full_player_name)
     responses = await agent.get_player_news(full_player_name)
-    for response in responses:
-        await ctx.send(response)
+    await _send_responses(ctx, responses)
 
 
 @bot.command(
     name="enddraft",
-    help="🏁 End the current draft\n\n"
-         "Description:\n"
-         "• End ongoing draft session\n"
-         "• Display final draft results\n"
-         "• Show complete team roster\n\n"
-         "Usage: `!enddraft`"
+    help=HELP_TABLE["enddraft"]
 )
 async def enddraft(ctx):
     """End the current draft and display results."""
     responses = await agent.end_draft(ctx.channel.id)
-    for response in responses:
-        await ctx.send(response)
+    await _send_responses(ctx, responses)
+
 
+async def main():
+    """Connect to the gateway and run until the bot is closed"""
+    async with bot:
+        await bot.start(token)
 
-# Start the bot, connecting it to the gateway
-bot.run(token)
+
+if __name__ == "__main__":
+    # The log handler bot.run would install, since the loop is started here instead
+    discord.utils.setup_logging()
+    
+    # Run on uvloop's faster event loop where it is installed (it does not support Windows)
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    # Start the bot, connecting it to the gateway
+    try:
+        asyncio.run(main(), loop_factory=loop_factory)
+    except KeyboardInterrupt:
+        # Ctrl+C shuts down quietly, as it did under bot.run
+        pass
@@ -0,0 +1,72 @@
+"""Help text for each bot command, shown by !help <command>"""
+
+HELP_TABLE = {
+    "compare": (
+        "🔄 Compare NBA players for fantasy value\n\n"
+        "Description:\n"
+        "• Compare multiple players' stats and value\n"
+        "• Analyze current injuries and performance\n"
+        "• Get detailed rankings and comparisons\n\n"
+        "Usage: `!compare player1 player2 [player3 ...]`\n"
+        "Example: `!compare \"LeBron James\" \"Stephen Curry\"`"
+    ),
+    "draft": (
+        "🎮 Start a fantasy basketball draft\n\n"
+        "Description:\n"
+        "• Initialize new draft session\n"
+        "• Set custom rounds and team count\n"
+        "• Configure your draft position\n\n"
+        "Usage: `!draft rounds pick_position total_picks`\n"
+        "Example: `!draft 13 1 12`"
+    ),
+    "pick": (
+        "✏️ Record a draft pick\n\n"
+        "Description:\n"
+        "• Record player selections\n"
+        "• Assign positions to your picks\n"
+        "• Track draft progress\n\n"
+        "Usage: `!pick number \"player_name\" [position]`\n"
+        "Example: `!pick 1 \"LeBron James\" SF`"
+    ),
+    "getrec": (
+        "💡 Get draft recommendations\n\n"
+        "Description:\n"
+        "• Get best available players\n"
+        "• Receive strategic advice\n"
+        "• Analyze team needs\n\n"
+        "Usage: `!getrec`"
+    ),
+    "players": (
+        "📊 Show available players\n\n"
+        "Description:\n"
+        "• View all available players\n"
+        "• See fantasy rankings\n"
+        "• Check player statistics\n\n"
+        "Usage: `!players`"
+    ),
+    "myteam": (
+        "👥 View your current team\n\n"
+        "Description:\n"
+        "• See your drafted players\n"
+        "• Check team composition\n"
+        "• View roster by position\n\n"
+        "Usage: `!myteam`"
+    ),
+    "news": (
+        "📰 Get player news and updates\n\n"
+        "Description:\n"
+        "• Check injury status\n"
+        "• See recent performance\n"
+        "• Get latest updates\n\n"
+        "Usage: `!news \"player_name\"`\n"
+        "Example: `!news \"LeBron James\"`"
+    ),
+    "enddraft": (
+        "🏁 End the current draft\n\n"
+        "Description:\n"
+        "• End ongoing draft session\n"
+        "• Display final draft results\n"
+        "• Show complete team roster\n\n"
+        "Usage: `!enddraft`"
+    ),
+}
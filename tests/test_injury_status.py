@@ -0,0 +1,21 @@
+import unittest
+
+from agent import reports_season_ending
+
+
+class ReportsSeasonEndingTest(unittest.TestCase):
+    def test_negated_mentions_do_not_count(self):
+        self.assertFalse(reports_season_ending("LeBron James has not suffered a season-ending injury."))
+        self.assertFalse(reports_season_ending("There is no indication he is out for the season."))
+        self.assertFalse(reports_season_ending("Doctors ruled out a season ending injury after the MRI."))
+        self.assertFalse(reports_season_ending("He is questionable for Friday with ankle soreness."))
+
+    def test_positive_reports_count(self):
+        self.assertTrue(reports_season_ending("Ja Morant will undergo shoulder surgery and is out for the season."))
+        self.assertTrue(reports_season_ending("He is healthy now. Reports confirm a season-ending ACL tear for teammate X."))
+        self.assertTrue(reports_season_ending("The team ruled him out for the season."))
+        self.assertTrue(reports_season_ending("It isn't minor. He suffered a season-ending injury."))
+
+
+if __name__ == "__main__":
+    unittest.main()
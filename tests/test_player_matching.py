@@ -0,0 +1,28 @@
+import unittest
+
+from agent import PlayerNameIndex, normalize_name
+
+RANKED_PLAYERS = ["Jalen Brunson", "Mark Williams", "Jalen Duren", "LeBron James", "Stephen Curry", "Michael Porter Jr."]
+
+
+class PlayerNameIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = PlayerNameIndex({name: {} for name in RANKED_PLAYERS})
+
+    def match(self, search_name):
+        return self.index.match(normalize_name(search_name))
+
+    def test_near_miss_names_of_unranked_players_do_not_match(self):
+        self.assertIsNone(self.match("Jaylen Brown"))
+        self.assertIsNone(self.match("Mike Williams"))
+        self.assertIsNone(self.match("Jalen Hood-Schifino"))
+
+    def test_typos_and_partial_names_still_match(self):
+        self.assertEqual(self.match("Lebron Jmaes"), "LeBron James")
+        self.assertEqual(self.match("Steph Curry"), "Stephen Curry")
+        self.assertEqual(self.match("Michael Porter"), "Michael Porter Jr.")
+        self.assertEqual(self.match("Mark Wiliams"), "Mark Williams")
+
+
+if __name__ == "__main__":
+    unittest.main()